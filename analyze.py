@@ -1163,7 +1163,7 @@ def main():
     papers_rows = []  # raw rows for influence scoring
     if PAPERS_DB_PATH.exists():
         print("Loading papers database...")
-        with open(PAPERS_DB_PATH) as f:
+        with open(PAPERS_DB_PATH, encoding="utf-8") as f:
             papers_db_payload = json.load(f)
         if isinstance(papers_db_payload, dict):
             papers_rows = papers_db_payload.get("papers", [])
@@ -1316,6 +1316,10 @@ def main():
 
         title = topic_data.get("title", meta.get("title", ""))
         category_name = meta.get("category_name", categories.get(meta.get("category_id"), ""))
+        if category_name:
+            # Low-cardinality strings repeated across thousands of topics:
+            # intern so every topic shares one object per value.
+            category_name = sys.intern(category_name)
         excluded_reason = excluded_corpus_reason(category_name, title)
         if excluded_reason == "category":
             excluded_category_count += 1
@@ -1382,7 +1386,8 @@ def main():
         all_reflection_links[tid] = incoming
 
         # Tags
-        tags = topic_data.get("tags", []) or []
+        tags = [sys.intern(tag) if isinstance(tag, str) else tag
+                for tag in topic_data.get("tags", []) or []]
 
         topics[tid] = {
             "id": tid,
@@ -1400,6 +1405,8 @@ def main():
             "primary_eips": sorted(primary_eips),
             "participants": [{"username": p["username"], "post_count": p["post_count"]}
                              for p in participants],
+            # Derived once here; the profile and thread passes only need names.
+            "participant_usernames": [p["username"] for p in participants],
             "first_post_excerpt": first_post_excerpt,
             "intro_lines": intro_lines,
         }
@@ -1474,7 +1481,7 @@ def main():
         })
 
     report_payload = {
-        "generated_at": datetime.now().isoformat()[:19],
+        "generated_at": datetime.now().strftime("%Y-%m-%dT%H:%M:%S"),
         "topics_with_coauthors": coauthor_topics,
         "resolved_names": resolved_list,
         "unresolved_names": unresolved_list,
@@ -1878,9 +1885,7 @@ def main():
         # Co-researchers: authors who participate in the same topics
         co_researchers = Counter()
         for tid in data["topic_ids"]:
-            for p in topics[tid]["participants"]:
-                if p["username"] != username:
-                    co_researchers[p["username"]] += 1
+            co_researchers.update(u for u in topics[tid]["participant_usernames"] if u != username)
 
         authors_output[username] = {
             "username": username,
@@ -1930,55 +1935,50 @@ def main():
         if not thread_topics:
             continue
 
-        dates = [topics[t]["date"] for t in thread_topics if topics[t]["date"]]
-        dates.sort()
-
-        # Key authors for this thread
-        thread_authors = Counter()
+        # Single pass over the thread's topics, binding each topic dict once.
+        dates = []
+        thread_authors = Counter()  # key authors for this thread
+        thread_eips = set()  # EIPs mentioned (for reference, not "shipped" claims)
+        quarter_counter = Counter()  # quarterly counts for sparkline
+        year_counter = Counter()  # for peak_year / active_years
+        thread_eip_counter = Counter()  # for top_eips
+        distinct_author_set = set()  # for author_diversity
         for tid in thread_topics:
-            for auth in topics[tid].get("authors", [topics[tid]["author"]]):
+            t = topics[tid]
+            d = t["date"]
+            if d:
+                dates.append(d)
+                year_counter[int(d[:4])] += 1
+            q = date_to_quarter(d)
+            if q:
+                quarter_counter[q] += 1
+            for auth in t.get("authors", [t["author"]]):
                 thread_authors[auth] += 1
-            for p in topics[tid]["participants"]:
-                thread_authors[p["username"]] += 0.5
-
-        # EIPs mentioned across the thread (for reference, not "shipped" claims)
-        thread_eips = set()
-        for tid in thread_topics:
-            thread_eips.update(topics[tid]["primary_eips"])
+            for p_username in t["participant_usernames"]:
+                thread_authors[p_username] += 0.5
+            thread_eips.update(t["primary_eips"])
+            thread_eip_counter.update(t["eip_mentions"])
+            distinct_author_set.add(t["author"])
+        dates.sort()
 
         # Sort topics by influence
         thread_topics_sorted = sorted(thread_topics, key=lambda t: topics[t]["influence_score"], reverse=True)
 
-        # Quarterly counts for sparkline
-        quarter_counter = Counter()
-        for tid in thread_topics:
-            q = date_to_quarter(topics[tid]["date"])
-            if q:
-                quarter_counter[q] += 1
         quarterly_counts = [{"q": q, "c": quarter_counter.get(q, 0)} for q in all_quarters]
 
         # --- Thread summary statistics ---
 
         # peak_year: year with the most topics in this thread
-        year_counter = Counter()
-        for tid in thread_topics:
-            d = topics[tid]["date"]
-            if d:
-                year_counter[int(d[:4])] += 1
         peak_year = year_counter.most_common(1)[0][0] if year_counter else None
 
         # active_years: years with >= 3 topics
         active_years = sorted(y for y, c in year_counter.items() if c >= 3)
 
         # top_eips: top 5 most-mentioned EIPs across thread's topics (by count)
-        thread_eip_counter = Counter()
-        for tid in thread_topics:
-            for eip in topics[tid]["eip_mentions"]:
-                thread_eip_counter[eip] += 1
         top_eips = [eip for eip, _count in thread_eip_counter.most_common(5)]
 
         # author_diversity: distinct authors / total topics (0-1)
-        distinct_authors = len({topics[tid]["author"] for tid in thread_topics})
+        distinct_authors = len(distinct_author_set)
         author_diversity = round(distinct_authors / len(thread_topics), 4) if thread_topics else 0
 
         threads_output[thread_id] = {
@@ -2010,8 +2010,7 @@ def main():
         fork_eip_set = set(fork["eips"])
         related_topics = []
         for tid in included:
-            topic_primary = set(topics[tid].get("primary_eips", []))
-            if topic_primary & fork_eip_set:
+            if not fork_eip_set.isdisjoint(topics[tid].get("primary_eips", [])):
                 related_topics.append(tid)
         related_topics.sort(key=lambda t: topics[t]["influence_score"], reverse=True)
 
@@ -2051,20 +2050,19 @@ def main():
     # Co-author graph
     # -----------------------------------------------------------------------
     print("Building co-author graph...")
+    # Every counted pair has weight >= 1, so the node set is collected while
+    # counting instead of in a second pass over the edge Counter.
     coauthor_edges = defaultdict(int)
+    coauthor_author_set = set()
     for tid in included:
-        authors = topics[tid].get("authors", [topics[tid]["author"]])
+        t = topics[tid]
+        authors = set(t.get("authors", [t["author"]]))
         if len(authors) < 2:
             continue
-        for a, b in combinations(sorted(set(authors)), 2):
+        coauthor_author_set.update(authors)
+        for a, b in combinations(sorted(authors), 2):
             coauthor_edges[(a, b)] += 1
 
-    coauthor_author_set = set()
-    for (a, b), weight in coauthor_edges.items():
-        if weight >= 1:
-            coauthor_author_set.add(a)
-            coauthor_author_set.add(b)
-
     coauthor_nodes = []
     for username in sorted(coauthor_author_set):
         data = author_data.get(username)
@@ -2076,10 +2074,10 @@ def main():
             "influence": round(influence, 1),
         })
 
-    coauthor_edge_list = []
-    for (a, b), weight in coauthor_edges.items():
-        if weight >= 1:
-            coauthor_edge_list.append({"source": a, "target": b, "weight": weight})
+    coauthor_edge_list = [
+        {"source": a, "target": b, "weight": weight}
+        for (a, b), weight in coauthor_edges.items()
+    ]
 
     print(f"  {len(coauthor_nodes)} author nodes, {len(coauthor_edge_list)} edges")
 
@@ -2184,6 +2182,12 @@ def main():
     # -----------------------------------------------------------------------
     # Build included topics output (only included ones, slimmed down)
     # -----------------------------------------------------------------------
+    # Index graph edges by target once; scanning graph_edges per topic made
+    # this step O(topics x edges).
+    incoming_by_target = defaultdict(list)
+    for e in graph_edges:
+        incoming_by_target[e["target"]].append(e["source"])
+
     topics_output = {}
     for tid in included:
         t = topics[tid]
@@ -2211,7 +2215,7 @@ def main():
             "participants": t["participants"][:5],
             "magicians_refs": topic_magicians_refs.get(tid, []),
             "outgoing_refs": sorted(all_internal_links.get(tid, set()) & included),
-            "incoming_refs": [e["source"] for e in graph_edges if e["target"] == tid],
+            "incoming_refs": incoming_by_target.get(tid, []),
         }
 
     # -----------------------------------------------------------------------
@@ -2921,7 +2925,7 @@ def main():
             "papers_count": len(papers_output),
             "paper_graph_nodes": len(paper_graph_nodes),
             "paper_graph_edges": len(paper_graph_edges),
-            "generated_at": datetime.now().isoformat()[:19],
+            "generated_at": datetime.now().strftime("%Y-%m-%dT%H:%M:%S"),
         },
         "eras": ERAS,
         "forks": forks_output,
@@ -2952,8 +2956,10 @@ def main():
         },
     }
 
+    # Compact separators: analysis.json is a machine-read intermediate, and
+    # indent=2 roughly doubles the size of the big node/edge arrays.
     with open(OUTPUT_PATH, "w") as f:
-        json.dump(output, f, indent=2, default=str)
+        json.dump(output, f, separators=(",", ":"), default=str)
 
     size_mb = OUTPUT_PATH.stat().st_size / (1024 * 1024)
     print(f"Done! {OUTPUT_PATH} ({size_mb:.1f} MB)")
@@ -2962,15 +2968,22 @@ def main():
 
     # Quick validation
     print("\n--- Validation ---")
-    for thread_id, thread in sorted(threads_output.items(), key=lambda x: x[1]["topic_count"], reverse=True):
-        print(f"  {thread['name']}: {thread['topic_count']} topics, "
-              f"EIPs mentioned: {thread['eip_mentions'][:5]}")
+    thread_lines = [
+        f"  {thread['name']}: {thread['topic_count']} topics, "
+        f"EIPs mentioned: {thread['eip_mentions'][:5]}"
+        for thread in sorted(threads_output.values(), key=lambda x: x["topic_count"], reverse=True)
+    ]
+    if thread_lines:
+        print("\n".join(thread_lines))
 
     print(f"\nTop 10 authors:")
-    for username in top_authors[:10]:
-        a = authors_output[username]
-        print(f"  {username}: {a['topics_created']} topics, "
-              f"influence={a['influence_score']:.0f}, years={a['active_years'][0]}-{a['active_years'][-1]}")
+    author_lines = [
+        f"  {username}: {a['topics_created']} topics, "
+        f"influence={a['influence_score']:.0f}, years={a['active_years'][0]}-{a['active_years'][-1]}"
+        for username, a in ((u, authors_output[u]) for u in top_authors[:10])
+    ]
+    if author_lines:
+        print("\n".join(author_lines))
 
 
 if __name__ == "__main__":
@@ -15,25 +15,31 @@ Usage:
 """
 
 import argparse
+import hashlib
 import json
 import math
 import re
-import subprocess
+import sys
 import time
-import urllib.parse
-from collections import Counter
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 
+from http_util import (
+    OPENALEX_RATE,
+    SEMANTIC_SCHOLAR_BASE,
+    cached_get_json,
+    http_get_json,
+    http_post_json,
+)
+
 
 SCRIPT_DIR = Path(__file__).resolve().parent
 SEED_PATH = SCRIPT_DIR / "papers-seed.json"
 OUTPUT_PATH = SCRIPT_DIR / "papers-db.json"
 
-OPENALEX_BASE = "https://api.openalex.org"
-SEMANTIC_SCHOLAR_BASE = "https://api.semanticscholar.org/graph/v1"
-USER_AGENT = "evolution-map-papers-builder/1.0"
-
 # Ethereum/domain-centric search queries.
 KEYWORD_QUERIES = [
     "ethereum",
@@ -200,29 +206,44 @@ def normalize_quotes(text):
         "\u201c", '"').replace("\u201d", '"').replace("`", "'")
 
 
+_DOI_URL_RE = re.compile(r"^https?://(dx\.)?doi\.org/", re.IGNORECASE)
+_ARXIV_URL_RE = re.compile(r"^https?://arxiv\.org/abs/", re.IGNORECASE)
+_ARXIV_DOI_RE = re.compile(r"10\.48550/arxiv\.", re.IGNORECASE)
+_OPENALEX_ID_RE = re.compile(r"/([AW]\d+)$")
+_TITLE_ESCAPE_RE = re.compile(r"\\[nrt]")
+_TITLE_NONWORD_RE = re.compile(r"[^a-z0-9]+")
+
+# The normalizers below are pure and see the same identifiers repeatedly as a
+# paper is upserted from keyword, author, seed and expansion sources.
+_NORMALIZE_CACHE_SIZE = 100_000
+
+
+@lru_cache(maxsize=_NORMALIZE_CACHE_SIZE)
 def normalize_doi(doi):
     if not doi:
         return None
     value = doi.strip()
-    value = re.sub(r"^https?://(dx\.)?doi\.org/", "", value, flags=re.IGNORECASE)
+    value = _DOI_URL_RE.sub("", value)
     value = value.strip().lower()
     return value or None
 
 
+@lru_cache(maxsize=_NORMALIZE_CACHE_SIZE)
 def normalize_arxiv(arxiv_id):
     if not arxiv_id:
         return None
     value = arxiv_id.strip()
-    value = re.sub(r"^https?://arxiv\.org/abs/", "", value, flags=re.IGNORECASE)
+    value = _ARXIV_URL_RE.sub("", value)
     value = value.lower()
     return value or None
 
 
+@lru_cache(maxsize=_NORMALIZE_CACHE_SIZE)
 def short_openalex_id(openalex_id):
     if not openalex_id:
         return None
     value = openalex_id.strip()
-    m = re.search(r"/([AW]\d+)$", value)
+    m = _OPENALEX_ID_RE.search(value)
     if m:
         return m.group(1)
     return value
@@ -232,111 +253,95 @@ def invert_abstract(idx):
     """Convert OpenAlex abstract_inverted_index to plain text."""
     if not isinstance(idx, dict) or not idx:
         return ""
-    max_pos = -1
-    for positions in idx.values():
-        if not positions:
-            continue
-        max_pos = max(max_pos, max(positions))
-    if max_pos < 0:
-        return ""
-    words = [""] * (max_pos + 1)
+    # Single flatten pass; the first token seen at a position wins.
+    by_pos = {}
     for token, positions in idx.items():
-        for pos in positions:
-            if 0 <= pos < len(words) and not words[pos]:
-                words[pos] = token
+        for pos in positions or ():
+            if pos >= 0 and pos not in by_pos:
+                by_pos[pos] = token
+    if not by_pos:
+        return ""
+    words = [""] * (max(by_pos) + 1)
+    for pos, token in by_pos.items():
+        words[pos] = token
     return normalize_space(" ".join(words))
 
 
+@lru_cache(maxsize=_NORMALIZE_CACHE_SIZE)
 def normalize_title_key(title):
     text = (title or "").lower()
     # Strip literal escape sequences from OpenAlex titles (e.g. literal \n, \t).
-    text = re.sub(r"\\[nrt]", " ", text)
-    return re.sub(r"[^a-z0-9]+", " ", text).strip()
+    text = _TITLE_ESCAPE_RE.sub(" ", text)
+    return _TITLE_NONWORD_RE.sub(" ", text).strip()
 
 
-def term_in_text(term, text):
-    """Phrase/term matching with word boundaries to avoid substring false positives."""
+@lru_cache(maxsize=None)
+def term_pattern(term):
+    """Compile the word-boundary regex used to match `term` in lowercased text."""
     escaped = re.escape(term.lower())
     escaped = escaped.replace(r"\ ", r"[\s\-]+")
     if re.fullmatch(r"[a-z0-9]{1,4}", term.lower()):
         pattern = rf"\b{escaped}\b"
     else:
         pattern = rf"(?<![a-z0-9]){escaped}(?![a-z0-9])"
-    return re.search(pattern, text) is not None
+    return re.compile(pattern)
 
 
-def http_get_json(path, params=None, retries=5, pause=0.15):
-    params = params or {}
-    query = urllib.parse.urlencode(params, doseq=True)
-    url = f"{OPENALEX_BASE}{path}"
-    if query:
-        url = f"{url}?{query}"
-    last_err = None
+def term_in_text(term, text):
+    """Phrase/term matching with word boundaries to avoid substring false positives.
 
-    for attempt in range(retries + 1):
-        try:
-            proc = subprocess.run(
-                [
-                    "curl",
-                    "-fsSL",
-                    "--connect-timeout",
-                    "10",
-                    "--max-time",
-                    "30",
-                    "-A",
-                    USER_AGENT,
-                    url,
-                ],
-                check=True,
-                capture_output=True,
-                text=True,
-            )
-            return json.loads(proc.stdout)
-        except Exception as err:  # noqa: BLE001
-            last_err = err
-            if attempt == retries:
-                break
-            backoff = pause * (2 ** attempt)
-            time.sleep(backoff)
-    raise RuntimeError(f"OpenAlex request failed after retries: {url}") from last_err
+    The pattern for each term is compiled once (term_pattern is memoized).
+    """
+    return term_pattern(term).search(text) is not None
 
 
-def http_post_json(url, body, retries=5, pause=1.0):
-    """POST JSON to a URL via curl, with retries and exponential backoff."""
-    payload_str = json.dumps(body)
-    last_err = None
+def term_canary(term):
+    """Literal substring that must appear in text for `term_pattern(term)` to match.
 
-    for attempt in range(retries + 1):
-        try:
-            proc = subprocess.run(
-                [
-                    "curl",
-                    "-fsSL",
-                    "--connect-timeout",
-                    "10",
-                    "--max-time",
-                    "60",
-                    "-A",
-                    USER_AGENT,
-                    "-H",
-                    "Content-Type: application/json",
-                    "--data",
-                    "@-",
-                    url,
-                ],
-                input=payload_str,
-                check=True,
-                capture_output=True,
-                text=True,
+    Spaces in a term match any run of whitespace/hyphens, so only the first
+    word is guaranteed to appear verbatim.
+    """
+    return term.lower().split()[0]
+
+
+# Patterns used by score_paper for every candidate, compiled once at import.
+# Each is paired with its canary so the regex only runs when a cheap `in`
+# check says a match is possible.
+ETHEREUM_PATTERNS = [(term_canary(t), term_pattern(t)) for t in ("ethereum", "eth2", "beacon chain")]
+EIP_MENTION_RE = re.compile(r"\beip[\s-]?\d+\b")
+DOMAIN_TERM_PATTERNS = {
+    domain: [(term, term_canary(term), term_pattern(term)) for term in terms]
+    for domain, terms in DOMAIN_TERMS.items()
+}
+
+
+def fetch_cursor_pages_concurrently(requests, max_pages, workers, cache_ttl=None):
+    """Walk OpenAlex /works cursor pagination for many queries in a thread pool.
+
+    `requests` is a list of (key, params) tuples. Each query's pages are walked
+    sequentially via `meta.next_cursor`, up to `max_pages` or until a page
+    comes back empty, while different queries run concurrently. Yields
+    (key, [payload, ...]) in request order, so callers see deterministic
+    results. Pages served from the disk cache skip the rate limiter.
+    """
+
+    def walk(params):
+        payloads = []
+        cursor = "*"
+        while cursor and len(payloads) < max_pages:
+            payload = cached_get_json(
+                "/works", {**params, "cursor": cursor}, ttl=cache_ttl, limiter=OPENALEX_RATE
             )
-            return json.loads(proc.stdout)
-        except Exception as err:  # noqa: BLE001
-            last_err = err
-            if attempt == retries:
+            payloads.append(payload)
+            if not payload.get("results"):
                 break
-            backoff = pause * (2 ** attempt)
-            time.sleep(backoff)
-    raise RuntimeError(f"POST request failed after retries: {url}") from last_err
+            cursor = (payload.get("meta") or {}).get("next_cursor")
+        return payloads
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = [(key, pool.submit(walk, params)) for key, params in requests]
+        for key, future in futures:
+            yield key, future.result()
 
 
 def paper_id_to_ss_id(paper):
@@ -395,6 +400,8 @@ def ss_batch_citations(papers):
 
     Returns dict mapping our canonical paper ID to SS result dict.
     Queries all known IDs (primary + aliases) and keeps the best result.
+    The batch response is positional, so each slot joins back to our paper
+    through the request chunk in O(1).
     """
     # Build mapping: SS ID → our paper ID
     ss_to_ours = {}
@@ -491,6 +498,34 @@ def author_name_tokens(name):
     return [t for t in re.findall(r"[a-z0-9]+", (name or "").lower()) if t]
 
 
+def score_author_candidate(author_name, cand):
+    """Rank an OpenAlex author record as a match for a seed name."""
+    display = cand.get("display_name", "")
+    target_tokens = set(author_name_tokens(author_name))
+    cand_tokens = set(author_name_tokens(display))
+    overlap = len(target_tokens & cand_tokens)
+    exact = 1 if display.strip().lower() == author_name.strip().lower() else 0
+    starts = 1 if display.strip().lower().startswith(author_name.strip().lower()) else 0
+    return (
+        exact * 100
+        + starts * 20
+        + overlap * 8
+        + math.log1p(cand.get("works_count", 0))
+        + math.log1p(cand.get("cited_by_count", 0)) * 0.2
+    )
+
+
+def best_author_candidate(author_name, candidates):
+    best = None
+    best_score = float("-inf")
+    for cand in candidates:
+        score = score_author_candidate(author_name, cand)
+        if score > best_score:
+            best_score = score
+            best = cand
+    return best
+
+
 def resolve_author(author_name):
     payload = http_get_json(
         "/authors",
@@ -499,33 +534,65 @@ def resolve_author(author_name):
             "per-page": 10,
             "select": "id,display_name,works_count,cited_by_count",
         },
+        limiter=OPENALEX_RATE,
     )
     candidates = payload.get("results", [])
     if not candidates:
         return None
+    return best_author_candidate(author_name, candidates)
 
-    target_tokens = set(author_name_tokens(author_name))
-    best = None
-    best_score = float("-inf")
-    for cand in candidates:
-        display = cand.get("display_name", "")
-        cand_tokens = set(author_name_tokens(display))
-        overlap = len(target_tokens & cand_tokens)
-        exact = 1 if display.strip().lower() == author_name.strip().lower() else 0
-        starts = 1 if display.strip().lower().startswith(author_name.strip().lower()) else 0
-        score = (
-            exact * 100
-            + starts * 20
-            + overlap * 8
-            + math.log1p(cand.get("works_count", 0))
-            + math.log1p(cand.get("cited_by_count", 0)) * 0.2
-        )
-        if score > best_score:
-            best_score = score
-            best = cand
-    return best
 
+# Names per OR'd display_name.search filter when resolving author seeds.
+AUTHOR_BATCH_SIZE = 25
+AUTHOR_BATCH_PER_PAGE = 200
+
+
+def resolve_authors_batched(author_names):
+    """Resolve many seed names with one OpenAlex request per chunk.
+
+    Each chunk is sent as a single `display_name.search:a|b|c` filter. A seed
+    only takes a batched candidate whose name covers all of the seed's tokens.
+    Seeds with no such candidate fall back to the per-name `resolve_author`
+    search. A full page means some names' candidates may have been cut off by
+    prolific namesakes, so the whole chunk falls back in that case.
+
+    Returns {name: best OpenAlex author record or None}.
+    """
+    resolved = {}
+    for i in range(0, len(author_names), AUTHOR_BATCH_SIZE):
+        chunk = author_names[i:i + AUTHOR_BATCH_SIZE]
+        # Commas separate OpenAlex filters and pipes separate OR terms.
+        terms = "|".join(re.sub(r"[,|]", " ", name) for name in chunk)
+        try:
+            payload = http_get_json(
+                "/authors",
+                {
+                    "filter": f"display_name.search:{terms}",
+                    "per-page": AUTHOR_BATCH_PER_PAGE,
+                    "select": "id,display_name,works_count,cited_by_count",
+                },
+                limiter=OPENALEX_RATE,
+            )
+            candidates = payload.get("results", [])
+        except RuntimeError as err:
+            print(f"  Warning: batched author lookup failed, falling back: {err}", flush=True)
+            candidates = []
+        if len(candidates) >= AUTHOR_BATCH_PER_PAGE:
+            # Truncated page: relevance ranking may have dropped the real author.
+            candidates = []
+
+        cand_tokens = [set(author_name_tokens(c.get("display_name", ""))) for c in candidates]
+        for name in chunk:
+            target = set(author_name_tokens(name))
+            matching = [c for c, toks in zip(candidates, cand_tokens) if target and target <= toks]
+            if matching:
+                resolved[name] = best_author_candidate(name, matching)
+            else:
+                resolved[name] = resolve_author(name)
+    return resolved
 
+
+@lru_cache(maxsize=_NORMALIZE_CACHE_SIZE)
 def canonical_paper_id(doi, arxiv_id, openalex_id, title, year):
     if doi:
         return f"doi:{doi}"
@@ -533,8 +600,9 @@ def canonical_paper_id(doi, arxiv_id, openalex_id, title, year):
         return f"arxiv:{arxiv_id}"
     if openalex_id:
         return f"openalex:{short_openalex_id(openalex_id)}"
-    title_key = re.sub(r"[^a-z0-9]+", "-", (title or "").lower()).strip("-")
-    return f"title:{title_key}:{year or 'na'}"
+    # Fixed-length digest of the normalized title (same key dedupe uses).
+    title_hash = hashlib.blake2b(normalize_title_key(title).encode("utf-8"), digest_size=8).hexdigest()
+    return f"title:{title_hash}:{year or 'na'}"
 
 
 def paper_from_openalex(work):
@@ -567,19 +635,20 @@ def paper_from_openalex(work):
         author = (a or {}).get("author") or {}
         name = normalize_quotes(normalize_space(author.get("display_name") or ""))
         if name:
-            authors.append(name)
+            authors.append(sys.intern(name))
 
-    abstract_text = invert_abstract(work.get("abstract_inverted_index"))
+    # Concept/keyword/author names recur across thousands of works; intern
+    # them so every candidate shares one string object per value.
     concept_terms = []
     for c in (work.get("concepts") or [])[:15]:
         name = normalize_space((c or {}).get("display_name") or "")
         if name:
-            concept_terms.append(name.lower())
+            concept_terms.append(sys.intern(name.lower()))
     keyword_terms = []
     for k in (work.get("keywords") or [])[:20]:
         name = normalize_space((k or {}).get("display_name") or "")
         if name:
-            keyword_terms.append(name.lower())
+            keyword_terms.append(sys.intern(name.lower()))
 
     year = work.get("publication_year")
     try:
@@ -614,18 +683,24 @@ def paper_from_openalex(work):
         "cited_by_count": cited_by_count,
         "referenced_works": referenced_works,
         "type": work.get("type"),
-        "abstract_text": abstract_text,
+        # Inverted lazily by paper_abstract_text(): most fetched works are
+        # merged, year-gated or citation-expansion rows that never need it.
+        "abstract_text": None,
+        "_abstract_index": work.get("abstract_inverted_index"),
         "concept_terms": concept_terms,
         "keyword_terms": keyword_terms,
     }
 
 
+def paper_abstract_text(paper):
+    """Return the paper's abstract, inverting its OpenAlex index on first use."""
+    idx = paper.pop("_abstract_index", None)
+    if paper.get("abstract_text") is None:
+        paper["abstract_text"] = invert_abstract(idx)
+    return paper["abstract_text"]
+
+
 def score_paper(paper, known_researchers, min_year):
-    title = (paper.get("title") or "").lower()
-    abstract = (paper.get("abstract_text") or "").lower()
-    concepts = " ".join(paper.get("concept_terms") or [])
-    keywords = " ".join(paper.get("keyword_terms") or [])
-    text = " ".join([title, abstract, concepts, keywords])
     score = 0.0
     reasons = []
     tags = set()
@@ -633,36 +708,38 @@ def score_paper(paper, known_researchers, min_year):
     year = paper.get("year")
     if year is None or year < min_year:
         reasons.append("below_min_year")
-        return -999.0, reasons, sorted(tags)
+        return -999.0, reasons, sorted(tags), 0
 
-    has_ethereum = (
-        term_in_text("ethereum", text)
-        or term_in_text("eth2", text)
-        or term_in_text("beacon chain", text)
-    )
+    title = (paper.get("title") or "").lower()
+    abstract = (paper_abstract_text(paper) or "").lower()
+    concepts = " ".join(paper.get("concept_terms") or [])
+    keywords = " ".join(paper.get("keyword_terms") or [])
+    text = " ".join([title, abstract, concepts, keywords])
+
+    has_ethereum = any(canary in text and pattern.search(text) for canary, pattern in ETHEREUM_PATTERNS)
     if has_ethereum:
         score += 6.0
         reasons.append("mentions_ethereum(+6)")
         tags.add("ethereum")
 
-    eip_match = re.search(r"\beip[\s-]?\d+\b", text)
+    eip_match = "eip" in text and EIP_MENTION_RE.search(text)
     if eip_match:
         score += 5.0
         reasons.append("mentions_eip(+5)")
         tags.add("eip")
 
     matched_domains = 0
-    for domain, terms in DOMAIN_TERMS.items():
-        matches = []
-        for term in terms:
-            if term_in_text(term, text):
-                matches.append(term)
+    for domain, term_patterns in DOMAIN_TERM_PATTERNS.items():
+        matches = [
+            term for term, canary, pattern in term_patterns
+            if canary in text and pattern.search(text)
+        ]
         if matches:
             matched_domains += 1
             tags.add(domain)
             domain_points = min(3.0, 0.8 * len(set(matches)))
             score += domain_points
-            reasons.append(f"domain_{domain}(+{domain_points:.1f})")
+            reasons.append(sys.intern(f"domain_{domain}(+{domain_points:.1f})"))
 
     matched_authors = []
     for author in paper.get("authors", []):
@@ -671,7 +748,7 @@ def score_paper(paper, known_researchers, min_year):
     if matched_authors:
         author_points = min(6.0, 2.0 * len(set(matched_authors)))
         score += author_points
-        reasons.append(f"known_researcher(+{author_points:.1f})")
+        reasons.append(sys.intern(f"known_researcher(+{author_points:.1f})"))
         tags.add("known-authors")
 
     cited_by = paper.get("cited_by_count") or 0
@@ -724,18 +801,46 @@ def merge_seed(seed_path):
             "openalex_id": row.get("openalex_id"),
             "cited_by_count": row.get("cited_by_count") or 0,
             "source": row.get("source") or "seed",
-            "tags": sorted({(t or "").strip().lower() for t in (row.get("tags") or []) if (t or "").strip()}),
+            "tags": sorted({sys.intern((t or "").strip().lower()) for t in (row.get("tags") or []) if (t or "").strip()}),
             "seed": True,
         }
     return out
 
 
+@lru_cache(maxsize=_NORMALIZE_CACHE_SIZE)
 def _is_arxiv_doi(doi):
     """True if the DOI is an arXiv preprint DOI (10.48550/arxiv.xxx)."""
-    return bool(doi and re.match(r"10\.48550/arxiv\.", doi, re.IGNORECASE))
+    return bool(doi and _ARXIV_DOI_RE.match(doi))
+
+
+# List fields unioned (and emitted sorted) when duplicate rows are merged.
+MERGED_LIST_FIELDS = ("authors", "tags", "relevance_reasons", "matched_queries", "source_types")
 
 
-def merge_paper_rows(existing, incoming):
+def refresh_canonical_id(row):
+    """Recompute `row`'s canonical ID from its merged identifiers.
+
+    The previous ID is kept in `aliases` when it changes.
+    """
+    new_id = canonical_paper_id(
+        row.get("doi"), row.get("arxiv_id"), row.get("openalex_id"), row.get("title"), row.get("year")
+    )
+    if new_id != row.get("id"):
+        aliases = set(row.get("aliases") or [])
+        aliases.add(row["id"])
+        aliases.discard(new_id)
+        row["aliases"] = sorted(a for a in aliases if a)
+        row["id"] = new_id
+    return row
+
+
+def merge_paper_rows(existing, incoming, merge_lists=True, refresh_id=True):
+    """Merge `incoming` into `existing` in place and return it.
+
+    With merge_lists=False / refresh_id=False the MERGED_LIST_FIELDS union and
+    the canonical ID recompute are left to the caller, which lets
+    dedupe_accepted_papers do each once per duplicate group.
+    """
     # Collect both DOIs/years before the base swap can clobber them.
     both_dois = [d for d in (existing.get("doi"), incoming.get("doi")) if d]
     both_years = [y for y in (existing.get("year"), incoming.get("year")) if y]
@@ -767,10 +872,11 @@ def merge_paper_rows(existing, incoming):
     if len(incoming.get("referenced_works") or []) > len(existing.get("referenced_works") or []):
         existing["referenced_works"] = incoming["referenced_works"]
 
-    for k in ("authors", "tags", "relevance_reasons", "matched_queries", "source_types"):
-        vals = set(existing.get(k) or [])
-        vals.update(incoming.get(k) or [])
-        existing[k] = sorted(v for v in vals if v)
+    if merge_lists:
+        for k in MERGED_LIST_FIELDS:
+            vals = set(existing.get(k) or [])
+            vals.update(incoming.get(k) or [])
+            existing[k] = sorted(v for v in vals if v)
 
     # Prefer the published (non-arXiv) DOI when merging preprint + published.
     published_dois = [d for d in both_dois if not _is_arxiv_doi(d)]
@@ -792,32 +898,122 @@ def merge_paper_rows(existing, incoming):
     # to use the published DOI.
     if both_years:
         existing["year"] = max(both_years)
-    new_doi = existing.get("doi")
-    new_arxiv = existing.get("arxiv_id")
-    new_oa = existing.get("openalex_id")
-    new_id = canonical_paper_id(new_doi, new_arxiv, new_oa, existing.get("title"), existing.get("year"))
-    if new_id != existing.get("id"):
-        aliases = set(existing.get("aliases") or [])
-        aliases.add(existing["id"])
-        aliases.discard(new_id)
-        existing["aliases"] = sorted(a for a in aliases if a)
-        existing["id"] = new_id
+    if refresh_id:
+        refresh_canonical_id(existing)
 
     return existing
 
 
-def dedupe_accepted_papers(papers):
-    deduped = {}
-    for paper in papers:
-        key = normalize_title_key(paper.get("title") or "")
-        if key not in deduped:
-            deduped[key] = paper
-        else:
-            deduped[key] = merge_paper_rows(deduped[key], paper)
-    return list(deduped.values())
+# Near-duplicate titles (preprint vs. published wording) must share a first
+# author surname, have years at most this far apart, agree on any non-arXiv
+# DOI, and reach this token-set Jaccard similarity.
+FUZZY_TITLE_JACCARD = 0.85
+FUZZY_TITLE_MAX_YEAR_GAP = 2
+# Words that mark a follow-up paper rather than a re-titled version
+# ("Two More Attacks on ..." vs "Two Attacks on ...").
+FUZZY_TITLE_SEQUEL_TOKENS = frozenset(
+    {"more", "further", "new", "revisited", "continued", "part", "ii", "iii", "iv", "v2", "v3"}
+)
+
+
+def _first_author_surname(paper):
+    authors = paper.get("authors") or []
+    if not authors:
+        return ""
+    parts = normalize_title_key(authors[0]).split()
+    return parts[-1] if parts else ""
 
 
-def build_database(min_score, min_year, query_pages, author_pages, per_page):
+def _fuzzy_title_roots(buckets):
+    """Map each title key to the title key of its near-duplicate group.
+
+    Exact title buckets are blocked by first-author surname, so candidate
+    pairs are only compared within a block, and then linked by union-find
+    when they pass the FUZZY_TITLE_* guards. A group's root is its earliest
+    title key, which keeps the output in first-occurrence order.
+    """
+    order = {key: i for i, key in enumerate(buckets)}
+    parent = {key: key for key in buckets}
+
+    def find(key):
+        while parent[key] != key:
+            parent[key] = parent[parent[key]]
+            key = parent[key]
+        return key
+
+    blocks = defaultdict(list)
+    for key, group in buckets.items():
+        surname = _first_author_surname(group[0])
+        if key and surname:
+            blocks[surname].append(key)
+
+    for keys in blocks.values():
+        if len(keys) < 2:
+            continue
+        info = []
+        for key in keys:
+            rep = buckets[key][0]
+            dois = {
+                d for d in (p.get("doi") for p in buckets[key]) if d and not _is_arxiv_doi(d)
+            }
+            info.append((key, frozenset(key.split()), rep.get("year"), dois))
+        for i, (key_a, tokens_a, year_a, dois_a) in enumerate(info):
+            for key_b, tokens_b, year_b, dois_b in info[i + 1:]:
+                if year_a and year_b and abs(year_a - year_b) > FUZZY_TITLE_MAX_YEAR_GAP:
+                    continue
+                if dois_a and dois_b and dois_a.isdisjoint(dois_b):
+                    continue
+                if len(tokens_a & tokens_b) < FUZZY_TITLE_JACCARD * len(tokens_a | tokens_b):
+                    continue
+                diff = tokens_a ^ tokens_b
+                if not diff.isdisjoint(FUZZY_TITLE_SEQUEL_TOKENS) or any(t.isdigit() for t in diff):
+                    continue
+                root_a, root_b = find(key_a), find(key_b)
+                if root_a != root_b:
+                    if order[root_b] < order[root_a]:
+                        root_a, root_b = root_b, root_a
+                    parent[root_b] = root_a
+
+    return {key: find(key) for key in buckets}
+
+
+def dedupe_accepted_papers(papers):
+    """Collapse rows sharing a (near-)identical title into one merged row.
+
+    Rows are bucketed by title key in one pass, and buckets whose titles are
+    near-duplicates are joined via _fuzzy_title_roots. Each group is then
+    reduced with merge_paper_rows, unioning the list fields and refreshing
+    the canonical ID once per group rather than once per pairwise merge.
+    Output order follows each group's first occurrence.
+    """
+    buckets = defaultdict(list)
+    for paper in papers:
+        buckets[normalize_title_key(paper.get("title") or "")].append(paper)
+
+    roots = _fuzzy_title_roots(buckets)
+    groups = defaultdict(list)
+    for key, group in buckets.items():
+        groups[roots[key]].extend(group)
+
+    deduped = []
+    for group in groups.values():
+        row = group[0]
+        if len(group) > 1:
+            merged_lists = {k: set() for k in MERGED_LIST_FIELDS}
+            for paper in group:
+                for k in MERGED_LIST_FIELDS:
+                    merged_lists[k].update(paper.get(k) or [])
+            for paper in group[1:]:
+                row = merge_paper_rows(row, paper, merge_lists=False, refresh_id=False)
+            for k, vals in merged_lists.items():
+                row[k] = sorted(v for v in vals if v)
+            refresh_canonical_id(row)
+        deduped.append(row)
+    return deduped
+
+
+def build_database(min_score, min_year, query_pages, author_pages, per_page, workers=8,
+                   cache_ttl=None):
     known_researchers = set()
     for name in AUTHOR_SEEDS:
         known_researchers.add(name.lower())
@@ -850,8 +1046,8 @@ def build_database(min_score, min_year, query_pages, author_pages, per_page):
         existing = entry["paper"]
         if (paper.get("cited_by_count") or 0) > (existing.get("cited_by_count") or 0):
             existing["cited_by_count"] = paper.get("cited_by_count")
-        if not existing.get("abstract_text") and paper.get("abstract_text"):
-            existing["abstract_text"] = paper["abstract_text"]
+        if not existing.get("_abstract_index") and paper.get("_abstract_index"):
+            existing["_abstract_index"] = paper["_abstract_index"]
         # Keep richer referenced_works list
         if len(paper.get("referenced_works") or []) > len(existing.get("referenced_works") or []):
             existing["referenced_works"] = paper["referenced_works"]
@@ -899,26 +1095,27 @@ def build_database(min_score, min_year, query_pages, author_pages, per_page):
 
     print("Fetching keyword-based candidates from OpenAlex...", flush=True)
     keyword_requests = 0
-    for q_idx, query in enumerate(KEYWORD_QUERIES, start=1):
+    keyword_queries = [
+        (
+            (q_idx, query),
+            {
+                "search": query,
+                "per-page": per_page,
+                "filter": f"from_publication_date:{min_year}-01-01",
+                "select": work_select,
+            },
+        )
+        for q_idx, query in enumerate(KEYWORD_QUERIES, start=1)
+    ]
+    for (q_idx, query), payloads in fetch_cursor_pages_concurrently(
+        keyword_queries, query_pages, workers, cache_ttl
+    ):
         print(f"  query {q_idx}/{len(KEYWORD_QUERIES)}: {query}", flush=True)
-        for page in range(1, query_pages + 1):
-            payload = http_get_json(
-                "/works",
-                {
-                    "search": query,
-                    "page": page,
-                    "per-page": per_page,
-                    "filter": f"from_publication_date:{min_year}-01-01",
-                    "select": work_select,
-                },
-            )
-            keyword_requests += 1
+        keyword_requests += len(payloads)
+        for payload in payloads:
             for raw_work in payload.get("results", []):
                 paper = paper_from_openalex(raw_work)
                 upsert_candidate(paper, "keyword", query)
-            if not payload.get("results"):
-                break
-            time.sleep(0.12)
 
     print(f"  Keyword requests: {keyword_requests}", flush=True)
     print(f"  Candidates after keyword phase: {len(work_candidates)}", flush=True)
@@ -934,8 +1131,9 @@ def build_database(min_score, min_year, query_pages, author_pages, per_page):
     print("Resolving author seeds...", flush=True)
     resolved_authors = {}
     seen_author_ids = {}  # OpenAlex author ID → first seed name
+    author_lookup = resolve_authors_batched(sorted(author_names))
     for name in sorted(author_names):
-        resolved = resolve_author(name)
+        resolved = author_lookup.get(name)
         if not resolved:
             continue
         author_id = short_openalex_id(resolved.get("id"))
@@ -949,33 +1147,32 @@ def build_database(min_score, min_year, query_pages, author_pages, per_page):
             "id": author_id,
             "display_name": resolved.get("display_name"),
         }
-        time.sleep(0.08)
 
     print(f"  Resolved authors: {len(resolved_authors)}", flush=True)
 
     print("Fetching author-based candidates from OpenAlex...", flush=True)
     author_requests = 0
-    for a_idx, (seed_name, author) in enumerate(resolved_authors.items(), start=1):
+    author_queries = [
+        (
+            (a_idx, seed_name),
+            {
+                "filter": f"authorships.author.id:{author['id']},from_publication_date:{min_year}-01-01",
+                "sort": "cited_by_count:desc",
+                "per-page": per_page,
+                "select": work_select,
+            },
+        )
+        for a_idx, (seed_name, author) in enumerate(resolved_authors.items(), start=1)
+    ]
+    for (a_idx, seed_name), payloads in fetch_cursor_pages_concurrently(
+        author_queries, author_pages, workers, cache_ttl
+    ):
         print(f"  author {a_idx}/{len(resolved_authors)}: {seed_name}", flush=True)
-        author_id = author["id"]
-        for page in range(1, author_pages + 1):
-            payload = http_get_json(
-                "/works",
-                {
-                    "filter": f"authorships.author.id:{author_id},from_publication_date:{min_year}-01-01",
-                    "sort": "cited_by_count:desc",
-                    "page": page,
-                    "per-page": per_page,
-                    "select": work_select,
-                },
-            )
-            author_requests += 1
+        author_requests += len(payloads)
+        for payload in payloads:
             for raw_work in payload.get("results", []):
                 paper = paper_from_openalex(raw_work)
                 upsert_candidate(paper, "author", seed_name)
-            if not payload.get("results"):
-                break
-            time.sleep(0.12)
 
     print(f"  Author requests: {author_requests}", flush=True)
     print(f"  Candidates after author phase: {len(work_candidates)}", flush=True)
@@ -996,6 +1193,7 @@ def build_database(min_score, min_year, query_pages, author_pages, per_page):
         paper["source_types"] = sorted(entry["source_types"])
         paper["source"] = "openalex"
         paper.pop("abstract_text", None)
+        paper.pop("_abstract_index", None)
         paper.pop("concept_terms", None)
         paper.pop("keyword_terms", None)
 
@@ -1018,12 +1216,9 @@ def build_database(min_score, min_year, query_pages, author_pages, per_page):
         domain_counter.update(t for t in paper.get("tags", []) if t in DOMAIN_TERMS)
 
     # Merge curated seed rows unconditionally.
+    by_id = {p["id"]: p for p in accepted}
     for seed_pid, seed_paper in seed_rows.items():
-        existing = None
-        for p in accepted:
-            if p["id"] == seed_pid:
-                existing = p
-                break
+        existing = by_id.get(seed_pid)
         if existing:
             existing_tags = set(existing.get("tags") or [])
             existing_tags.update(seed_paper.get("tags") or [])
@@ -1046,6 +1241,7 @@ def build_database(min_score, min_year, query_pages, author_pages, per_page):
         seeded["matched_queries"] = []
         seeded["source_types"] = ["seed"]
         accepted.append(seeded)
+        by_id[seeded["id"]] = seeded
         source_counter.update(["seed"])
         domain_counter.update(t for t in seeded.get("tags", []) if t in DOMAIN_TERMS)
 
@@ -1082,6 +1278,7 @@ def build_database(min_score, min_year, query_pages, author_pages, per_page):
 
     if expansion_ids:
         expansion_added = 0
+        accepted_ids = {p["id"] for p in accepted}
         # Batch-fetch from OpenAlex in chunks of 50
         for chunk_start in range(0, len(expansion_ids), 50):
             chunk = expansion_ids[chunk_start:chunk_start + 50]
@@ -1103,7 +1300,7 @@ def build_database(min_score, min_year, query_pages, author_pages, per_page):
                         if not paper:
                             continue
                         # Check if already in accepted by ID
-                        if any(a["id"] == paper["id"] for a in accepted):
+                        if paper["id"] in accepted_ids:
                             continue
                         # Give it a relevance boost proportional to citation count
                         cite_count = external_ref_counts.get(
@@ -1124,9 +1321,11 @@ def build_database(min_score, min_year, query_pages, author_pages, per_page):
                         paper["source"] = "citation_expansion"
                         # Strip large text fields (same as scored papers)
                         paper.pop("abstract_text", None)
+                        paper.pop("_abstract_index", None)
                         paper.pop("concept_terms", None)
                         paper.pop("keyword_terms", None)
                         accepted.append(paper)
+                        accepted_ids.add(paper["id"])
                         expansion_added += 1
                         # Track the new OA ID to avoid re-fetching
                         new_short = short_openalex_id(work.get("id"))
@@ -1194,6 +1393,14 @@ def main():
     parser.add_argument("--query-pages", type=int, default=2, help="Pages per keyword query")
     parser.add_argument("--author-pages", type=int, default=1, help="Pages per author")
     parser.add_argument("--per-page", type=int, default=100, help="OpenAlex page size (<=200)")
+    parser.add_argument("--workers", type=int, default=8, help="Concurrent OpenAlex page fetches")
+    parser.add_argument(
+        "--cache-ttl-hours",
+        type=float,
+        default=24.0,
+        help="Reuse cached OpenAlex search pages younger than this (see .cache/openalex/)",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Always refetch OpenAlex search pages")
     parser.add_argument(
         "--skip-ss",
         action="store_true",
@@ -1208,6 +1415,8 @@ def main():
         query_pages=args.query_pages,
         author_pages=args.author_pages,
         per_page=max(1, min(200, args.per_page)),
+        workers=args.workers,
+        cache_ttl=None if args.no_cache else args.cache_ttl_hours * 3600,
     )
 
     # Semantic Scholar enrichment (after all OpenAlex collection and dedup).
@@ -1219,8 +1428,10 @@ def main():
     else:
         print("Skipping Semantic Scholar enrichment (--skip-ss)", flush=True)
 
-    with open(output_path, "w") as f:
-        json.dump(payload, f, indent=2, ensure_ascii=True)
+    # json.dump streams chunks straight to the file; writing UTF-8 directly
+    # avoids \uXXXX-escaping every non-ASCII author name.
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, indent=2, ensure_ascii=False)
         f.write("\n")
 
     stats = payload["stats"]
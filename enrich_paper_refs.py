@@ -5,7 +5,8 @@ Multi-pass enrichment pipeline:
   Pass 1: OpenAlex batch by OA ID (papers missing referenced_works)
   Pass 2: OpenAlex DOI-based fallback (preprint → published version)
   Pass 3: Semantic Scholar batch POST (all papers — union with OA refs)
-  Pass 4: Semantic Scholar per-paper fallback (remaining papers without refs)
+  Pass 4: Semantic Scholar re-batch of ids Pass 3 missed (failed batches,
+          papers sharing an SS id with another paper)
 
 Usage:
     python3 enrich_paper_refs.py
@@ -13,115 +14,178 @@ Usage:
 """
 
 import argparse
+import gzip
+import hashlib
 import json
+import os
 import re
-import subprocess
 import time
-import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
+from http_util import (
+    OPENALEX_RATE,
+    SEMANTIC_SCHOLAR_BASE,
+    WindowRateLimiter,
+    cached_get_json,
+    http_post_json,
+    read_json_cache,
+    write_json_cache,
+)
+
 SCRIPT_DIR = Path(__file__).resolve().parent
 PAPERS_DB_PATH = SCRIPT_DIR / "papers-db.json"
-OPENALEX_BASE = "https://api.openalex.org"
-SEMANTIC_SCHOLAR_BASE = "https://api.semanticscholar.org/graph/v1"
-USER_AGENT = "evolution-map-papers-builder/1.0"
+SS_CACHE_DIR = SCRIPT_DIR / ".cache" / "semantic_scholar"
+# Papers after the OpenAlex passes, so --resume can restart at Pass 3.
+CHECKPOINT_PATH = SCRIPT_DIR / ".cache" / "enrich" / "openalex-passes.json.gz"
+# OpenAlex works last seen without referenced_works (see run_openalex_passes).
+NO_REFS_PATH = SCRIPT_DIR / ".cache" / "enrich" / "openalex-no-refs.json"
 
 # OpenAlex filter supports up to 50 IDs per pipe-separated list
 BATCH_SIZE = 50
 # SS batch POST supports up to 500 papers per request
 SS_BATCH_SIZE = 500
 # Semantic Scholar rate limit: 100 requests / 5 min for unauthenticated
-SS_PAUSE = 3.2  # seconds between requests (~19/min, safe margin)
+SS_WINDOW_CALLS = 95  # small safety margin under the 100
+SS_WINDOW_SECONDS = 300.0
+SS_MIN_INTERVAL = 1.0  # never burst faster than 1 req/s
+
+
+_OPENALEX_ID_RE = re.compile(r"/([AW]\d+)$")
 
 
+@lru_cache(maxsize=1 << 20)
 def short_openalex_id(openalex_id):
     if not openalex_id:
         return None
     value = openalex_id.strip()
-    m = re.search(r"/([AW]\d+)$", value)
+    m = _OPENALEX_ID_RE.search(value)
     if m:
         return m.group(1)
     return value
 
 
-def http_get_json(path, params=None, retries=5, pause=0.15):
-    params = params or {}
-    query = urllib.parse.urlencode(params, doseq=True)
-    url = f"{OPENALEX_BASE}{path}"
-    if query:
-        url = f"{url}?{query}"
-
-    for attempt in range(retries + 1):
-        try:
-            proc = subprocess.run(
-                [
-                    "curl", "-fsSL",
-                    "--connect-timeout", "10",
-                    "--max-time", "30",
-                    "-A", USER_AGENT,
-                    url,
-                ],
-                check=True,
-                capture_output=True,
-                text=True,
-            )
-            return json.loads(proc.stdout)
-        except Exception as err:
-            if attempt == retries:
-                raise RuntimeError(f"OpenAlex request failed: {url}") from err
-            time.sleep(pause * (2 ** attempt))
-
-
-def ss_get_json(path, retries=3, pause=1.0):
-    """GET JSON from Semantic Scholar API via curl."""
-    url = f"{SEMANTIC_SCHOLAR_BASE}{path}"
-    for attempt in range(retries + 1):
-        try:
-            proc = subprocess.run(
-                [
-                    "curl", "-fsSL",
-                    "--connect-timeout", "10",
-                    "--max-time", "30",
-                    "-A", USER_AGENT,
-                    url,
-                ],
-                check=True,
-                capture_output=True,
-                text=True,
-            )
-            return json.loads(proc.stdout)
-        except Exception as err:
-            if attempt == retries:
-                return None  # Soft fail for SS — don't crash
-            time.sleep(pause * (2 ** attempt))
-
-
-def ss_post_json(path, body, retries=3, pause=1.0):
-    """POST JSON to Semantic Scholar API via curl."""
-    url = f"{SEMANTIC_SCHOLAR_BASE}{path}"
-    body_json = json.dumps(body)
-    for attempt in range(retries + 1):
-        try:
-            proc = subprocess.run(
-                [
-                    "curl", "-fsSL",
-                    "--connect-timeout", "10",
-                    "--max-time", "60",
-                    "-X", "POST",
-                    "-H", "Content-Type: application/json",
-                    "-A", USER_AGENT,
-                    "-d", body_json,
-                    url,
-                ],
-                check=True,
-                capture_output=True,
-                text=True,
+def ss_post_json(path, body, retries=3, pause=1.0, limiter=None):
+    """POST JSON to Semantic Scholar API over the pooled connection."""
+    try:
+        return http_post_json(
+            f"{SEMANTIC_SCHOLAR_BASE}{path}", body, retries=retries, pause=pause, limiter=limiter
+        )
+    except RuntimeError:
+        return None  # Soft fail for SS
+
+
+# Semantic Scholar budget is shared by all workers and covers retries too;
+# 429s are retried honoring a capped Retry-After (see http_util.retry_delay).
+SS_RATE = WindowRateLimiter(SS_WINDOW_CALLS, SS_WINDOW_SECONDS, min_interval=SS_MIN_INTERVAL)
+
+
+def fetch_works_concurrently(filters, select, workers, cache_ttl=None):
+    """Fetch all /works results for each OpenAlex filter using a thread pool.
+
+    A filter of at most BATCH_SIZE ids always fits in one 200-result page,
+    so each worker normally makes a single request; further pages are only
+    fetched when a page comes back full. Yields the result lists in the
+    same order as `filters`, so callers can apply updates deterministically
+    on the main thread while requests overlap. Pages younger than
+    `cache_ttl` seconds are served from the on-disk cache.
+    """
+    per_page = 200
+
+    def fetch_all(filter_str):
+        results = []
+        page = 1
+        while True:
+            data = cached_get_json(
+                "/works",
+                {
+                    "filter": filter_str,
+                    "select": select,
+                    "per_page": per_page,
+                    "page": page,
+                },
+                ttl=cache_ttl,
+                limiter=OPENALEX_RATE,
             )
-            return json.loads(proc.stdout)
-        except Exception as err:
-            if attempt == retries:
-                return None  # Soft fail for SS
-            time.sleep(pause * (2 ** attempt))
+            page_results = data.get("results") or []
+            results.extend(page_results)
+            if len(page_results) < per_page:
+                return results
+            page += 1
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = [pool.submit(fetch_all, f) for f in filters]
+        for future in futures:
+            yield future.result()
+
+
+def cached_ss_batch(path, batch, ttl=None):
+    """SS batch POST with an on-disk gzip JSON cache.
+
+    Entries live in SS_CACHE_DIR keyed by sha256(path + ids in request
+    order), so a re-run after a mid-pass failure skips every batch that
+    already succeeded. The order is part of the key because the response
+    list is positional: callers join it to `batch` by index. `ttl=None`
+    bypasses the cache. Failed (None) responses are never cached, and SS_RATE
+    is only waited on for network requests (each attempt, retries included).
+    """
+    cache_path = None
+    if ttl is not None:
+        key = hashlib.sha256(f"{path}|{','.join(batch)}".encode("utf-8")).hexdigest()
+        cache_path = SS_CACHE_DIR / f"{key}.json.gz"
+        cached = read_json_cache(cache_path, ttl)
+        if cached is not None:
+            return cached
+
+    data = ss_post_json(path, {"ids": batch}, limiter=SS_RATE)
+    if cache_path is not None and isinstance(data, list):
+        write_json_cache(cache_path, data)
+    return data
+
+
+def ss_post_batches_pipelined(path, batches, workers=2, cache_ttl=None):
+    """POST each id batch to Semantic Scholar with up to `workers` in flight.
+
+    Requests share SS_RATE so the aggregate rate stays under the API limit;
+    the next batch is already on the wire while the caller processes the
+    previous response. Yields `(batch, data)` in batch order.
+    """
+
+    def post(batch):
+        return cached_ss_batch(path, batch, ttl=cache_ttl)
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = [pool.submit(post, batch) for batch in batches]
+        for batch, future in zip(batches, futures):
+            yield batch, future.result()
+
+
+def map_ss_refs(ss_refs, oa_by_doi, oa_by_arxiv):
+    """Map SS reference entries to OpenAlex short IDs of papers in our corpus.
+
+    A reference's DOI is tried first and, only when the DOI is unknown, its
+    arXiv ID. Unmatched references are dropped.
+    """
+    out = []
+    for ref_entry in ss_refs:
+        ext = ref_entry.get("externalIds") if isinstance(ref_entry, dict) else None
+        if not ext:
+            continue
+        doi = ext.get("DOI")
+        if doi:
+            doi = doi.lower()
+            if doi in oa_by_doi:
+                oa_short = oa_by_doi[doi]
+                if oa_short:
+                    out.append(oa_short)
+                continue
+        arxiv = ext.get("ArXiv")
+        if arxiv:
+            oa_short = oa_by_arxiv.get(arxiv.lower())
+            if oa_short:
+                out.append(oa_short)
+    return out
 
 
 def ss_paper_id(paper):
@@ -140,29 +204,38 @@ def ss_paper_id(paper):
     return None
 
 
-def main():
-    parser = argparse.ArgumentParser()
-    parser.add_argument("--dry-run", action="store_true", help="Preview without writing")
-    args = parser.parse_args()
+def load_no_refs_index():
+    """Return {oa_short: {"checked_at"}} for works known to lack refs."""
+    try:
+        with open(NO_REFS_PATH, encoding="utf-8") as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return index if isinstance(index, dict) else {}
 
-    print("Loading papers-db.json...")
-    with open(PAPERS_DB_PATH) as f:
-        payload = json.load(f)
 
-    papers = payload.get("papers", [])
-    print(f"  {len(papers)} papers loaded")
+def save_no_refs_index(index):
+    NO_REFS_PATH.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = NO_REFS_PATH.with_name(f"{NO_REFS_PATH.name}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(index, f, separators=(",", ":"), sort_keys=True)
+    os.replace(tmp_path, NO_REFS_PATH)
 
-    has_refs_initial = sum(1 for p in papers if p.get("referenced_works"))
-    print(f"  {has_refs_initial} already have referenced_works")
 
-    if args.dry_run:
-        needs = sum(1 for p in papers if not p.get("referenced_works"))
-        print(f"Dry run — {needs} papers need enrichment.")
-        return
+def run_openalex_passes(papers, workers, cache_ttl=None):
+    """Fill `referenced_works` from OpenAlex (Passes 1 and 2), in place.
 
+    Pages younger than `cache_ttl` seconds come from the shared .cache/openalex/ store. Works
+    that OpenAlex returned without references are remembered in
+    NO_REFS_PATH with the time they were checked, and Pass 1 skips them for
+    the same `cache_ttl` (`None` always refetches).
+    """
     # -----------------------------------------------------------------------
     # Pass 1: OpenAlex batch by OA ID (papers missing referenced_works)
     # -----------------------------------------------------------------------
+    no_refs = load_no_refs_index()
+    now = time.time()
+    skipped = 0
     needs_refs = []
     for paper in papers:
         oa_id = paper.get("openalex_id")
@@ -173,47 +246,49 @@ def main():
             continue
         if paper.get("referenced_works"):
             continue
+        known = no_refs.get(short)
+        checked_at = known.get("checked_at") if isinstance(known, dict) else None
+        if cache_ttl is not None and isinstance(checked_at, (int, float)) and now - checked_at < cache_ttl:
+            skipped += 1
+            continue
         needs_refs.append((short, paper))
 
     print(f"\nPass 1: OpenAlex batch by OA ID for {len(needs_refs)} papers...")
+    if skipped:
+        print(f"  Skipping {skipped} papers OpenAlex recently returned without references")
     enriched = 0
     total_refs = 0
     batches = [needs_refs[i:i + BATCH_SIZE] for i in range(0, len(needs_refs), BATCH_SIZE)]
 
-    for batch_idx, batch in enumerate(batches, 1):
-        ids_filter = "|".join(f"https://openalex.org/{short}" for short, _ in batch)
+    filters = [
+        "openalex:" + "|".join(f"https://openalex.org/{short}" for short, _ in batch)
+        for batch in batches
+    ]
+    batch_results = fetch_works_concurrently(
+        filters, "id,referenced_works", workers, cache_ttl=cache_ttl
+    )
+    for batch_idx, (batch, results) in enumerate(zip(batches, batch_results), 1):
         print(f"  Batch {batch_idx}/{len(batches)} ({len(batch)} papers)...", flush=True)
 
         batch_lookup = {short: paper for short, paper in batch}
-        cursor = "*"
-        while cursor:
-            data = http_get_json(
-                "/works",
-                {
-                    "filter": f"openalex:{ids_filter}",
-                    "select": "id,referenced_works",
-                    "per_page": 200,
-                    "cursor": cursor,
-                },
-            )
-            for work in data.get("results", []):
-                work_id = short_openalex_id(work.get("id"))
-                if work_id and work_id in batch_lookup:
-                    refs = []
-                    for ref_id in work.get("referenced_works") or []:
-                        short_ref = short_openalex_id(ref_id)
-                        if short_ref:
-                            refs.append(short_ref)
-                    batch_lookup[work_id]["referenced_works"] = refs
-                    enriched += 1
-                    total_refs += len(refs)
-            meta = data.get("meta", {})
-            cursor = meta.get("next_cursor")
-            if not data.get("results"):
-                break
-        time.sleep(0.2)
+        for work in results:
+            work_id = short_openalex_id(work.get("id"))
+            if work_id and work_id in batch_lookup:
+                refs = []
+                for ref_id in work.get("referenced_works") or []:
+                    short_ref = short_openalex_id(ref_id)
+                    if short_ref:
+                        refs.append(short_ref)
+                batch_lookup[work_id]["referenced_works"] = refs
+                enriched += 1
+                total_refs += len(refs)
+                if refs:
+                    no_refs.pop(work_id, None)
+                else:
+                    no_refs[work_id] = {"checked_at": now}
 
     print(f"  Enriched {enriched} papers with {total_refs} total references")
+    save_no_refs_index(no_refs)
 
     # -----------------------------------------------------------------------
     # Pass 2: DOI-based fallback for papers still missing referenced_works.
@@ -237,97 +312,165 @@ def main():
             for i in range(0, len(still_missing), BATCH_SIZE)
         ]
 
-        for batch_idx, batch in enumerate(doi_batches, 1):
-            doi_filter = "|".join(
-                f"https://doi.org/{p['doi']}" for p in batch
-            )
+        filters = [
+            "doi:" + "|".join(f"https://doi.org/{p['doi']}" for p in batch)
+            for batch in doi_batches
+        ]
+        batch_results = fetch_works_concurrently(
+            filters, "id,doi,referenced_works", workers, cache_ttl=cache_ttl
+        )
+        for batch_idx, (batch, results) in enumerate(zip(doi_batches, batch_results), 1):
             print(f"  Batch {batch_idx}/{len(doi_batches)} ({len(batch)} papers)...", flush=True)
 
             doi_lookup = {}
             for p in batch:
                 doi_lookup[p["doi"].lower()] = p
 
-            cursor = "*"
-            while cursor:
-                data = http_get_json(
-                    "/works",
-                    {
-                        "filter": f"doi:{doi_filter}",
-                        "select": "id,doi,referenced_works",
-                        "per_page": 200,
-                        "cursor": cursor,
-                    },
-                )
-                for work in data.get("results", []):
-                    work_refs = work.get("referenced_works") or []
-                    if not work_refs:
-                        continue
-                    work_doi = (work.get("doi") or "").replace("https://doi.org/", "").lower()
-                    if work_doi and work_doi in doi_lookup:
-                        paper = doi_lookup[work_doi]
-                        if len(work_refs) > len(paper.get("referenced_works") or []):
-                            refs = []
-                            for ref_id in work_refs:
-                                short_ref = short_openalex_id(ref_id)
-                                if short_ref:
-                                    refs.append(short_ref)
-                            paper["referenced_works"] = refs
-                            new_oa = work.get("id")
-                            if new_oa:
-                                paper["openalex_id"] = new_oa
-                            doi_enriched += 1
-                            doi_total_refs += len(refs)
-                meta = data.get("meta", {})
-                cursor = meta.get("next_cursor")
-                if not data.get("results"):
-                    break
-            time.sleep(0.2)
+            for work in results:
+                work_refs = work.get("referenced_works") or []
+                if not work_refs:
+                    continue
+                work_doi = (work.get("doi") or "").removeprefix("https://doi.org/").lower()
+                paper = doi_lookup.get(work_doi)
+                if paper is not None:
+                    if len(work_refs) > len(paper.get("referenced_works") or []):
+                        refs = []
+                        for ref_id in work_refs:
+                            short_ref = short_openalex_id(ref_id)
+                            if short_ref:
+                                refs.append(short_ref)
+                        paper["referenced_works"] = refs
+                        new_oa = work.get("id")
+                        if new_oa:
+                            paper["openalex_id"] = new_oa
+                        doi_enriched += 1
+                        doi_total_refs += len(refs)
 
         print(f"  DOI fallback enriched {doi_enriched} papers with {doi_total_refs} total references")
 
+
+def load_checkpoint():
+    """Return papers saved after the OpenAlex passes, or None if stale/missing.
+
+    The checkpoint is only valid for the papers-db.json it was built from,
+    which is tracked by file size and mtime.
+    """
+    try:
+        with gzip.open(CHECKPOINT_PATH, "rt", encoding="utf-8") as f:
+            saved = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if saved.get("source") != _papers_db_fingerprint():
+        return None
+    return saved.get("papers")
+
+
+def save_checkpoint(papers):
+    CHECKPOINT_PATH.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = CHECKPOINT_PATH.with_name(f"{CHECKPOINT_PATH.name}.tmp")
+    with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+        json.dump({"source": _papers_db_fingerprint(), "papers": papers}, f, ensure_ascii=False)
+    os.replace(tmp_path, CHECKPOINT_PATH)
+
+
+def _papers_db_fingerprint():
+    st = PAPERS_DB_PATH.stat()
+    return [st.st_size, st.st_mtime_ns]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--dry-run", action="store_true", help="Preview without writing")
+    parser.add_argument("--workers", type=int, default=8, help="Concurrent OpenAlex batch fetches")
+    parser.add_argument(
+        "--cache-ttl-hours",
+        type=float,
+        default=24.0,
+        help="Reuse cached OpenAlex/SS responses and no-refs results younger than this (see .cache/)",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Ignore the response and no-refs caches")
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Start at Pass 3 from the checkpoint saved after the OpenAlex passes",
+    )
+    args = parser.parse_args()
+
+    print("Loading papers-db.json...")
+    with open(PAPERS_DB_PATH, encoding="utf-8") as f:
+        payload = json.load(f)
+
+    papers = payload.get("papers", [])
+    print(f"  {len(papers)} papers loaded")
+
+    has_refs_initial = sum(1 for p in papers if p.get("referenced_works"))
+    print(f"  {has_refs_initial} already have referenced_works")
+
+    if args.dry_run:
+        needs = sum(1 for p in papers if not p.get("referenced_works"))
+        print(f"Dry run — {needs} papers need enrichment.")
+        return
+
+    checkpoint = load_checkpoint() if args.resume else None
+    if checkpoint is not None:
+        papers = payload["papers"] = checkpoint
+        print("Resumed from OpenAlex pass checkpoint; skipping Passes 1-2")
+    else:
+        run_openalex_passes(
+            papers,
+            args.workers,
+            cache_ttl=None if args.no_cache else args.cache_ttl_hours * 3600,
+        )
+        save_checkpoint(papers)
+
     # -----------------------------------------------------------------------
     # Pass 3: Semantic Scholar batch POST for ALL papers with a DOI/arXiv ID.
     # Uses POST /paper/batch with references.externalIds field.
     # This UNIONS SS references with any existing OA references.
     # -----------------------------------------------------------------------
     # Build lookup: OA short ID / DOI / arXiv → paper in our corpus
+    # and SS identifier → paper, all in a single pass.
     oa_by_doi = {}
     oa_by_arxiv = {}
     oa_by_short = {}
+    ss_id_to_paper = {}
+    # Papers whose SS id another paper also maps to; Pass 3 only fills the last.
+    ss_shadowed = []
     for paper in papers:
+        oa_id = short_openalex_id(paper.get("openalex_id"))
         doi = paper.get("doi")
         if doi:
-            oa_by_doi[doi.lower()] = short_openalex_id(paper.get("openalex_id"))
+            oa_by_doi[doi.lower()] = oa_id
         arxiv = paper.get("arxiv_id")
         if arxiv:
-            oa_by_arxiv[arxiv.lower()] = short_openalex_id(paper.get("openalex_id"))
-        oa_id = short_openalex_id(paper.get("openalex_id"))
+            oa_by_arxiv[arxiv.lower()] = oa_id
         if oa_id:
             oa_by_short[oa_id] = paper
-
-    # Collect SS identifiers for all papers
-    ss_id_to_paper = {}
-    for paper in papers:
         sid = ss_paper_id(paper)
         if sid:
+            shadowed = ss_id_to_paper.get(sid)
+            if shadowed is not None:
+                ss_shadowed.append((sid, shadowed))
             ss_id_to_paper[sid] = paper
 
     ss_ids = list(ss_id_to_paper.keys())
+    ss_failed_sids = []
     if ss_ids:
         print(f"\nPass 3: Semantic Scholar batch for {len(ss_ids)} papers (union with OA refs)...")
         ss_batch_enriched = 0
         ss_batch_added_refs = 0
 
         ss_batches = [ss_ids[i:i + SS_BATCH_SIZE] for i in range(0, len(ss_ids), SS_BATCH_SIZE)]
-        for batch_idx, batch in enumerate(ss_batches, 1):
+        responses = ss_post_batches_pipelined(
+            "/paper/batch?fields=externalIds,references.externalIds",
+            ss_batches,
+            cache_ttl=None if args.no_cache else args.cache_ttl_hours * 3600,
+        )
+        for batch_idx, (batch, data) in enumerate(responses, 1):
             print(f"  Batch {batch_idx}/{len(ss_batches)} ({len(batch)} papers)...", flush=True)
-            data = ss_post_json(
-                "/paper/batch?fields=externalIds,references.externalIds",
-                {"ids": batch},
-            )
             if not data or not isinstance(data, list):
                 print(f"  Warning: SS batch returned no data", flush=True)
-                time.sleep(SS_PAUSE)
+                ss_failed_sids.extend(batch)
                 continue
 
             for i, entry in enumerate(data):
@@ -342,23 +485,10 @@ def main():
                 if not ss_refs:
                     continue
 
-                # Convert SS references to OA short IDs
                 existing_refs = set(paper.get("referenced_works") or [])
-                new_refs_added = 0
-                for ref_entry in ss_refs:
-                    if not ref_entry or not isinstance(ref_entry, dict):
-                        continue
-                    ext = ref_entry.get("externalIds") or {}
-                    ref_doi = (ext.get("DOI") or "").lower()
-                    ref_arxiv = (ext.get("ArXiv") or "").lower()
-                    oa_short = None
-                    if ref_doi and ref_doi in oa_by_doi:
-                        oa_short = oa_by_doi[ref_doi]
-                    elif ref_arxiv and ref_arxiv in oa_by_arxiv:
-                        oa_short = oa_by_arxiv[ref_arxiv]
-                    if oa_short and oa_short not in existing_refs:
-                        existing_refs.add(oa_short)
-                        new_refs_added += 1
+                before = len(existing_refs)
+                existing_refs.update(map_ss_refs(ss_refs, oa_by_doi, oa_by_arxiv))
+                new_refs_added = len(existing_refs) - before
 
                 if new_refs_added > 0 or not paper.get("referenced_works"):
                     paper["referenced_works"] = sorted(existing_refs)
@@ -366,61 +496,53 @@ def main():
                         ss_batch_enriched += 1
                         ss_batch_added_refs += new_refs_added
 
-            time.sleep(SS_PAUSE)
-
         print(f"  SS batch added {ss_batch_added_refs} new refs across {ss_batch_enriched} papers")
 
     # -----------------------------------------------------------------------
-    # Pass 4: Semantic Scholar per-paper fallback for papers still without refs.
+    # Pass 4: re-batch only the SS ids Pass 3 never answered for a paper:
+    # ids from batches that failed outright, and papers shadowed in
+    # ss_id_to_paper by a later paper with the same id. Everything else
+    # already got its definitive Pass 3 answer, so asking again adds nothing.
     # -----------------------------------------------------------------------
-    ss_candidates = []
-    for paper in papers:
-        if paper.get("referenced_works"):
-            continue
-        sid = ss_paper_id(paper)
-        if sid:
-            ss_candidates.append((sid, paper))
-
-    if ss_candidates:
-        print(f"\nPass 4: Semantic Scholar per-paper fallback for {len(ss_candidates)} papers...")
+    retry_by_sid = {}
+    for sid in ss_failed_sids:
+        paper = ss_id_to_paper[sid]
+        if not paper.get("referenced_works"):
+            retry_by_sid.setdefault(sid, []).append(paper)
+    for sid, paper in ss_shadowed:
+        if not paper.get("referenced_works"):
+            retry_by_sid.setdefault(sid, []).append(paper)
+
+    if retry_by_sid:
+        print(f"\nPass 4: Semantic Scholar re-batch for {len(retry_by_sid)} ids missed by Pass 3...")
         ss_enriched = 0
         ss_total_refs = 0
 
-        for idx, (sid, paper) in enumerate(ss_candidates, 1):
-            if idx % 20 == 0 or idx == 1:
-                print(f"  [{idx}/{len(ss_candidates)}] {paper.get('title', '?')[:50]}...", flush=True)
-
-            data = ss_get_json(
-                f"/paper/{sid}/references?fields=externalIds&limit=500"
-            )
-            if not data or "data" not in data:
-                time.sleep(SS_PAUSE)
+        sids = list(retry_by_sid)
+        retry_batches = [sids[i:i + SS_BATCH_SIZE] for i in range(0, len(sids), SS_BATCH_SIZE)]
+        responses = ss_post_batches_pipelined(
+            "/paper/batch?fields=externalIds,references.externalIds",
+            retry_batches,
+            cache_ttl=None if args.no_cache else args.cache_ttl_hours * 3600,
+        )
+        for batch_idx, (batch, data) in enumerate(responses, 1):
+            print(f"  Batch {batch_idx}/{len(retry_batches)} ({len(batch)} papers)...", flush=True)
+            if not data or not isinstance(data, list):
+                print("  Warning: SS batch returned no data", flush=True)
                 continue
 
-            refs = []
-            for ref_entry in data.get("data") or []:
-                cited = ref_entry.get("citedPaper", {})
-                if not cited:
+            for sid, entry in zip(batch, data):
+                if not entry or not isinstance(entry, dict):
                     continue
-                ext = cited.get("externalIds") or {}
-                ref_doi = (ext.get("DOI") or "").lower()
-                ref_arxiv = (ext.get("ArXiv") or "").lower()
-                oa_short = None
-                if ref_doi and ref_doi in oa_by_doi:
-                    oa_short = oa_by_doi[ref_doi]
-                elif ref_arxiv and ref_arxiv in oa_by_arxiv:
-                    oa_short = oa_by_arxiv[ref_arxiv]
-                if oa_short:
-                    refs.append(oa_short)
-
-            if refs:
-                paper["referenced_works"] = refs
-                ss_enriched += 1
-                ss_total_refs += len(refs)
-
-            time.sleep(SS_PAUSE)
+                refs = map_ss_refs(entry.get("references") or [], oa_by_doi, oa_by_arxiv)
+                if not refs:
+                    continue
+                for paper in retry_by_sid[sid]:
+                    paper["referenced_works"] = refs
+                    ss_enriched += 1
+                    ss_total_refs += len(refs)
 
-        print(f"  SS per-paper enriched {ss_enriched} papers with {ss_total_refs} total references")
+        print(f"  SS re-batch enriched {ss_enriched} papers with {ss_total_refs} total references")
 
     # Summary
     has_refs_final = sum(1 for p in papers if p.get("referenced_works"))
@@ -431,9 +553,14 @@ def main():
 
     # Write back
     print("Writing papers-db.json...")
-    with open(PAPERS_DB_PATH, "w") as f:
-        json.dump(payload, f, indent=2, ensure_ascii=True)
+    # Write to a sibling temp file and rename, so an interrupted run never
+    # leaves a truncated papers-db.json behind.
+    tmp_path = PAPERS_DB_PATH.with_suffix(".json.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, indent=2, ensure_ascii=False)
         f.write("\n")
+    os.replace(tmp_path, PAPERS_DB_PATH)
+    CHECKPOINT_PATH.unlink(missing_ok=True)
     print("Done!")
 
 
@@ -13,6 +13,7 @@ import json
 import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from urllib.parse import urlparse
 
@@ -45,6 +46,16 @@ for fork_name, eips in FORKS_EIP_MAP.items():
 # Regex to extract topic ID from Discourse URLs
 TOPIC_ID_RE = re.compile(r"/t/[^/]+/(\d+)")
 
+# Author annotations: (@handle), (<email>) and bare <email>
+AUTHOR_ANNOTATION_RE = re.compile(r"\s*\(@[^)]*\)|\s*\(<[^>]*>\)|\s*<[^>]*>")
+ET_AL_RE = re.compile(r"^et\s+al\.?$", re.IGNORECASE)
+
+# A line consisting of just "---" (surrounding whitespace allowed)
+FRONT_MATTER_FENCE_RE = re.compile(r"^[^\S\n]*---[^\S\n]*$", re.MULTILINE)
+
+ABSTRACT_RE = re.compile(r"^##\s*Abstract\s*\n+(.*?)(?:\n##|\Z)", re.MULTILINE | re.DOTALL)
+WHITESPACE_RE = re.compile(r"\s+")
+
 
 def parse_front_matter(text):
     """Parse the first ---...--- block into a dict of key: value pairs.
@@ -54,31 +65,18 @@ def parse_front_matter(text):
     - Comma-separated lists (requires field)
     - Multiline author fields with (@handle) annotations
     """
-    lines = text.split("\n")
-
-    # Find opening ---
-    start = None
-    for i, line in enumerate(lines):
-        if line.strip() == "---":
-            start = i
-            break
-    if start is None:
+    opening = FRONT_MATTER_FENCE_RE.search(text)
+    if opening is None:
         return {}
-
-    # Find closing ---
-    end = None
-    for i in range(start + 1, len(lines)):
-        if lines[i].strip() == "---":
-            end = i
-            break
-    if end is None:
+    closing = FRONT_MATTER_FENCE_RE.search(text, opening.end())
+    if closing is None:
         return {}
 
     result = {}
     current_key = None
     current_value = None
 
-    for line in lines[start + 1:end]:
+    for line in text[opening.end() + 1:closing.start()].split("\n"):
         # Continuation line (starts with whitespace, no colon before content)
         if line and line[0] in (" ", "\t") and current_key:
             current_value += " " + line.strip()
@@ -112,13 +110,10 @@ def parse_authors(author_str):
         if not part:
             continue
         # Skip "et al." entries
-        if re.match(r"^et\s+al\.?$", part.strip(), re.IGNORECASE):
+        if ET_AL_RE.match(part):
             continue
         # Remove (@handle), (<email>), and <email> annotations
-        name = re.sub(r"\s*\(@[^)]*\)", "", part)
-        name = re.sub(r"\s*\(<[^>]*>\)", "", name)
-        name = re.sub(r"\s*<[^>]*>", "", name)
-        name = name.strip()
+        name = AUTHOR_ANNOTATION_RE.sub("", part).strip()
         if name:
             names.append(name)
     return names
@@ -178,14 +173,11 @@ def parse_eip_file(filepath):
 
     # Extract Abstract section from markdown body (first paragraph after ## Abstract)
     abstract = None
-    abstract_match = re.search(
-        r"^##\s*Abstract\s*\n+(.*?)(?:\n##|\Z)",
-        text, re.MULTILINE | re.DOTALL,
-    )
+    abstract_match = ABSTRACT_RE.search(text)
     if abstract_match:
         abstract = abstract_match.group(1).strip()
         # Collapse to single line, limit length
-        abstract = re.sub(r"\s+", " ", abstract)[:500]
+        abstract = WHITESPACE_RE.sub(" ", abstract)[:500]
 
     return {
         "eip": eip_num,
@@ -232,8 +224,12 @@ def main():
     ethresearch_count = 0
     fork_count = 0
 
-    for filepath in files:
-        meta = parse_eip_file(filepath)
+    # Files are independent; parse them across processes. map() keeps the
+    # sorted file order, so the catalog is built identically.
+    with ProcessPoolExecutor() as pool:
+        metas = list(pool.map(parse_eip_file, files, chunksize=64))
+
+    for meta in metas:
         if meta is None:
             errors += 1
             continue
@@ -0,0 +1,266 @@
+"""Shared HTTP plumbing for the paper scripts (build_papers_db, enrich_paper_refs).
+
+Stdlib-only: per-thread keep-alive connections, jittered retries that honor
+Retry-After, call-rate limiters, and the gzip JSON response cache under
+.cache/openalex/.
+"""
+
+import gzip
+import hashlib
+import http.client
+import json
+import os
+import random
+import ssl
+import threading
+import time
+import urllib.parse
+from collections import deque
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+OPENALEX_CACHE_DIR = SCRIPT_DIR / ".cache" / "openalex"
+
+OPENALEX_BASE = "https://api.openalex.org"
+# Contact address for the OpenAlex polite pool (higher, steadier rate limits).
+OPENALEX_MAILTO = os.environ.get("OPENALEX_MAILTO")
+SEMANTIC_SCHOLAR_BASE = "https://api.semanticscholar.org/graph/v1"
+USER_AGENT = "evolution-map-papers-builder/1.0"
+
+
+_HTTP_STATE = threading.local()
+_SSL_CONTEXT = ssl.create_default_context()
+_REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+
+
+def _http_connection(netloc):
+    """Return this thread's kept-alive HTTPS connection to `netloc`."""
+    conns = getattr(_HTTP_STATE, "conns", None)
+    if conns is None:
+        conns = _HTTP_STATE.conns = {}
+    conn = conns.get(netloc)
+    if conn is None:
+        conn = http.client.HTTPSConnection(netloc, timeout=30, context=_SSL_CONTEXT)
+        conns[netloc] = conn
+    return conn
+
+
+def _drop_http_connection(netloc):
+    conn = getattr(_HTTP_STATE, "conns", {}).pop(netloc, None)
+    if conn is not None:
+        conn.close()
+
+
+class HTTPStatusError(RuntimeError):
+    """Non-2xx response; keeps the status and any Retry-After hint."""
+
+    def __init__(self, status, url, retry_after=None):
+        super().__init__(f"HTTP {status} for {url}")
+        self.status = status
+        try:
+            self.retry_after = float(retry_after) if retry_after else None
+        except ValueError:
+            self.retry_after = None  # HTTP-date form; fall back to backoff
+
+
+# Upper bound on a server-sent Retry-After, so one bad header cannot stall a run.
+MAX_RETRY_AFTER = 60.0
+
+
+def retry_delay(err, attempt, pause):
+    """Seconds to wait before retry `attempt` (0-based) after `err`.
+
+    Honors a 429/503 Retry-After header (capped at MAX_RETRY_AFTER); otherwise
+    exponential backoff with jitter so concurrent workers do not retry in
+    lockstep.
+    """
+    if isinstance(err, HTTPStatusError) and err.retry_after is not None:
+        return min(err.retry_after, MAX_RETRY_AFTER)
+    return random.uniform(pause * 0.5, pause * (2 ** attempt))
+
+
+def http_request_json(method, url, body=None, timeout=30, max_redirects=3):
+    """Send one request over a pooled keep-alive connection and parse JSON.
+
+    Connections are cached per thread and per host, so consecutive OpenAlex /
+    Semantic Scholar calls reuse the same TCP+TLS session instead of paying a
+    process spawn and handshake each time. Raises on transport errors and
+    non-2xx responses; callers own the retry policy.
+    """
+    for _ in range(max_redirects + 1):
+        parts = urllib.parse.urlsplit(url)
+        target = parts.path or "/"
+        if parts.query:
+            target = f"{target}?{parts.query}"
+        headers = {
+            "User-Agent": USER_AGENT,
+            "Accept": "application/json",
+            "Accept-Encoding": "gzip",
+        }
+        if body is not None:
+            headers["Content-Type"] = "application/json"
+
+        conn = _http_connection(parts.netloc)
+        conn.timeout = timeout
+        try:
+            conn.request(method, target, body=body, headers=headers)
+            resp = conn.getresponse()
+            data = resp.read()
+            if resp.getheader("Content-Encoding", "").lower() == "gzip":
+                data = gzip.decompress(data)
+        except (http.client.HTTPException, OSError):
+            _drop_http_connection(parts.netloc)
+            raise
+        if resp.will_close:
+            _drop_http_connection(parts.netloc)
+
+        if resp.status in _REDIRECT_STATUSES and resp.getheader("Location"):
+            url = urllib.parse.urljoin(url, resp.getheader("Location"))
+            continue
+        if not 200 <= resp.status < 300:
+            raise HTTPStatusError(resp.status, url, resp.getheader("Retry-After"))
+        return json.loads(data)
+    raise RuntimeError(f"Too many redirects: {url}")
+
+
+def http_get_json(path, params=None, retries=5, pause=0.15, limiter=None):
+    """GET an OpenAlex API path (adding the polite-pool mailto), with retries.
+
+    `limiter`, if given, is waited on before every attempt, retries included.
+    """
+    params = dict(params or {})
+    if OPENALEX_MAILTO:
+        params.setdefault("mailto", OPENALEX_MAILTO)
+    query = urllib.parse.urlencode(params, doseq=True)
+    url = f"{OPENALEX_BASE}{path}"
+    if query:
+        url = f"{url}?{query}"
+    last_err = None
+
+    for attempt in range(retries + 1):
+        if limiter is not None:
+            limiter.wait()
+        try:
+            return http_request_json("GET", url, timeout=30)
+        except Exception as err:  # noqa: BLE001
+            last_err = err
+            if attempt == retries:
+                break
+            time.sleep(retry_delay(err, attempt, pause))
+    raise RuntimeError(f"OpenAlex request failed after retries: {url}") from last_err
+
+
+def http_post_json(url, body, retries=5, pause=1.0, limiter=None):
+    """POST JSON to a URL over a pooled connection, with retries and exponential backoff.
+
+    `limiter`, if given, is waited on before every attempt, retries included.
+    """
+    payload = json.dumps(body).encode("utf-8")
+    last_err = None
+
+    for attempt in range(retries + 1):
+        if limiter is not None:
+            limiter.wait()
+        try:
+            return http_request_json("POST", url, body=payload, timeout=60)
+        except Exception as err:  # noqa: BLE001
+            last_err = err
+            if attempt == retries:
+                break
+            time.sleep(retry_delay(err, attempt, pause))
+    raise RuntimeError(f"POST request failed after retries: {url}") from last_err
+
+
+class RateLimiter:
+    """Thread-safe limiter spacing calls at least 1/rate seconds apart."""
+
+    def __init__(self, rate_per_sec):
+        self.interval = 1.0 / rate_per_sec if rate_per_sec > 0 else 0.0
+        self._lock = threading.Lock()
+        self._next_at = 0.0
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_at)
+            self._next_at = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class WindowRateLimiter:
+    """Thread-safe sliding-window limiter: at most `max_calls` per `period` seconds.
+
+    Unlike a fixed pause, calls go out immediately while the window has
+    budget left and only block once it is spent, until the oldest call ages
+    out. `min_interval` still spaces consecutive calls.
+    """
+
+    def __init__(self, max_calls, period, min_interval=0.0):
+        self.max_calls = max_calls
+        self.period = period
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._sent = deque(maxlen=max_calls)  # scheduled times of the last calls
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            slot = now
+            if len(self._sent) == self.max_calls:
+                slot = max(slot, self._sent[0] + self.period)
+            if self._sent:
+                slot = max(slot, self._sent[-1] + self.min_interval)
+            self._sent.append(slot)
+        if slot > now:
+            time.sleep(slot - now)
+
+
+# OpenAlex polite pool allows ~10 req/s; stay a little under it.
+OPENALEX_RATE = RateLimiter(8.0)
+
+
+def read_json_cache(cache_path, ttl):
+    """Return the cached JSON at `cache_path` if younger than `ttl`, else None."""
+    try:
+        if time.time() - cache_path.stat().st_mtime < ttl:
+            with gzip.open(cache_path, "rt", encoding="utf-8") as f:
+                return json.load(f)
+    except (OSError, ValueError):
+        pass  # missing or corrupt entry: refetch
+    return None
+
+
+def write_json_cache(cache_path, data):
+    """Atomically write `data` as gzip JSON (safe with concurrent writers)."""
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{threading.get_ident()}.tmp")
+    with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+        json.dump(data, f)
+    os.replace(tmp_path, cache_path)
+
+
+def _cache_key(path, params):
+    query = urllib.parse.urlencode(sorted((params or {}).items()), doseq=True)
+    return hashlib.sha256(f"{path}?{query}".encode("utf-8")).hexdigest()
+
+
+def cached_get_json(path, params=None, ttl=None, limiter=None):
+    """OpenAlex GET with an on-disk gzip JSON cache.
+
+    Responses live in OPENALEX_CACHE_DIR keyed by sha256(path + sorted
+    params). A hit younger than `ttl` seconds is returned without touching
+    the network; `ttl=None` bypasses the cache entirely. `limiter` is only
+    waited on for network requests (each attempt, retries included).
+    """
+    cache_path = None
+    if ttl is not None:
+        cache_path = OPENALEX_CACHE_DIR / f"{_cache_key(path, params)}.json.gz"
+        cached = read_json_cache(cache_path, ttl)
+        if cached is not None:
+            return cached
+
+    payload = http_get_json(path, params, limiter=limiter)
+    if cache_path is not None:
+        write_json_cache(cache_path, payload)
+    return payload
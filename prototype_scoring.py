@@ -26,24 +26,30 @@ Usage:
 
 from __future__ import annotations
 
+import heapq
 import json
 import math
+import re
 import sys
-from bisect import bisect_left
-from datetime import date, datetime
+from datetime import date
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Tuple
 
 
 # Constants
 CURRENT_YEAR = 2026  # Recency damping anchor
+# Paper year → intrinsic multiplier; other years are undamped (1.0)
+RECENCY_DAMPING = {CURRENT_YEAR: 0.6, CURRENT_YEAR - 1: 0.75, CURRENT_YEAR - 2: 0.9}
+# Same forms strptime accepted for "%Y-%m-%d", "%Y-%m" and "%Y"
+DATE_RE = re.compile(r"(\d{4})(?:-(\d{1,2})(?:-(\d{1,2}))?)?\Z")
 
 
 # ------------------------------ Utilities ---------------------------------
 def load_json(path: Path) -> Any:
     try:
-        with path.open("r", encoding="utf-8") as f:
-            return json.load(f)
+        # json.loads detects the encoding itself, so skip the text wrapper
+        return json.loads(path.read_bytes())
     except FileNotFoundError:
         sys.exit(f"Error: File not found: {path}")
     except json.JSONDecodeError as e:
@@ -62,18 +68,19 @@ def parse_date(d: Any) -> date | None:
             return date(int(d), 1, 1)
         except Exception:
             return None
-    s = str(d).strip()
-    # Try full ISO first
-    for fmt in ("%Y-%m-%d", "%Y-%m", "%Y"):
+    return _parse_date_str(str(d).strip())
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_str(s: str) -> date | None:
+    # YYYY, YYYY-MM or YYYY-MM-DD; missing month/day default to 1
+    m = DATE_RE.match(s)
+    if m:
+        year, month, day = m.groups()
         try:
-            dt = datetime.strptime(s, fmt)
-            # Fill missing parts (month/day) with 1
-            year = dt.year
-            month = dt.month if "%m" in fmt else 1
-            day = dt.day if "%d" in fmt else 1
-            return date(year, month, day)
+            return date(int(year), int(month or 1), int(day or 1))
         except ValueError:
-            continue
+            pass
     # Try fromisoformat (covers some variants)
     try:
         return date.fromisoformat(s)
@@ -85,20 +92,27 @@ def percentile_ranks(values: List[float]) -> List[float]:
     """Compute percentile_rank per the spec for a list of values.
 
     Definition: for value v in values, return count(values < v)/(n-1) if n>1 else 0.5.
-    We use a sorted copy and bisect_left for O(n log n).
+    We sort the indices once and walk them in order: each value's rank is the
+    position of the first element of its run of ties, so no per-element
+    bisect is needed. O(n log n).
     """
     n = len(values)
     if n == 0:
         return []
     if n == 1:
         return [0.5]
-    sorted_vals = sorted(values)
+    order = sorted(range(n), key=values.__getitem__)
     denom = float(n - 1)
-    out = []
-    for v in values:
-        # number strictly less is index of first occurrence
-        idx = bisect_left(sorted_vals, v)
-        out.append(idx / denom)
+    out = [0.0] * n
+    rank = 0.0
+    prev = None
+    for pos, i in enumerate(order):
+        v = values[i]
+        if pos == 0 or v != prev:
+            # number strictly less is the position of the first tie
+            rank = pos / denom
+            prev = v
+        out[i] = rank
     return out
 
 
@@ -118,23 +132,25 @@ def trunc(s: str, maxlen: int) -> str:
 # ------------------------------ Scoring ------------------------------------
 def score_topics(all_topics: Dict[str, Dict[str, Any]],
                  eip_intrinsic: Dict[str, float],
-                 shipped_fork_names: set[str],
-                 eip_catalog: Dict[str, Dict[str, Any]]) -> Tuple[Dict[str, float], Dict[str, float]]:
+                 shipped_fork_names: frozenset[str],
+                 eip_catalog: Dict[str, Dict[str, Any]]) -> Tuple[Dict[str, float], Dict[str, float], List[str]]:
     """Compute topic scores.
 
-    Returns (intrinsic, final_normalized)
+    Returns (intrinsic, boosted_raw, topic_ids); topic_ids is the row order
+    of both dicts, reused by the caller for normalization.
     """
     topic_ids = list(all_topics.keys())
     # Phase 1: intrinsic
-    cit_raw = [float(all_topics[tid].get("in_degree", 0) or 0) for tid in topic_ids]
+    # One walk over the topics for both features; math functions bound locally
+    sqrt, log1p = math.sqrt, math.log1p
+    cit_raw = []
     eng_raw = []
-    for tid in topic_ids:
-        t = all_topics[tid]
+    for t in all_topics.values():
+        cit_raw.append(float(t.get("in_degree", 0) or 0))
         likes = float(t.get("like_count", 0) or 0)
         posts = float(t.get("posts_count", 0) or 0)
         views = float(t.get("views", 0) or 0)
-        eng = likes + math.sqrt(max(posts, 0.0)) + math.log1p(max(views, 0.0))
-        eng_raw.append(eng)
+        eng_raw.append(likes + sqrt(max(posts, 0.0)) + log1p(max(views, 0.0)))
     cit_pct = percentile_ranks(cit_raw)
     eng_pct = percentile_ranks(eng_raw)
     intrinsic = {tid: 0.50 * cit_pct[i] + 0.50 * eng_pct[i] for i, tid in enumerate(topic_ids)}
@@ -143,37 +159,39 @@ def score_topics(all_topics: Dict[str, Dict[str, Any]],
     # - +0.05 per mentioned EIP with intrinsic >= 0.3, capped at +0.15
     # - +0.03 for each Final EIP mentioned
     # - +0.05 for each EIP whose fork is shipped mentioned
+    # Per-EIP flags are resolved once here rather than per topic mention.
+    good_eip = {k for k, v in eip_intrinsic.items() if v >= 0.3}
+    final_eip = set()
+    shipped_eip = set()
+    for k, e in eip_catalog.items():
+        if not isinstance(e, dict):
+            continue
+        if str(e.get("status", "")) == "Final":
+            final_eip.add(k)
+        if e.get("fork") in shipped_fork_names:
+            shipped_eip.add(k)
+
     boosted_raw = {}
     for tid in topic_ids:
-        t = all_topics[tid]
-        mentions = t.get("eip_mentions", []) or []
-        boost = 0.0
-        good_eips = 0
-        for eip in mentions:
-            eip_str = str(eip)
-            ei = eip_intrinsic.get(eip_str, 0.0)
-            if ei >= 0.3:
-                good_eips += 1
-        boost += min(0.15, 0.05 * good_eips)
+        mentions = all_topics[tid].get("eip_mentions", []) or []
+        mention_ids = [str(eip) for eip in mentions]
+        good_eips = sum(1 for eip_str in mention_ids if eip_str in good_eip)
+        boost = min(0.15, 0.05 * good_eips)
 
         # Extra boosts from Final and shipped fork status
-        for eip in mentions:
-            eip_str = str(eip)
-            e = eip_catalog.get(eip_str)
-            if not isinstance(e, dict):
-                continue
-            if str(e.get("status", "")) == "Final":
+        for eip_str in mention_ids:
+            if eip_str in final_eip:
                 boost += 0.03
-            if (e.get("fork") or None) in shipped_fork_names:
+            if eip_str in shipped_eip:
                 boost += 0.05
 
         boosted_raw[tid] = clamp01(intrinsic[tid] + boost)
 
     # Return both intrinsic and boosted_raw; normalization is done by caller
-    return intrinsic, boosted_raw
+    return intrinsic, boosted_raw, topic_ids
 
 
-def score_eips(eip_catalog: Dict[str, Dict[str, Any]], shipped_fork_names: set[str]) -> Tuple[Dict[str, float], Dict[str, float]]:
+def score_eips(eip_catalog: Dict[str, Dict[str, Any]], shipped_fork_names: frozenset[str]) -> Tuple[Dict[str, float], Dict[str, float]]:
     """Compute EIP intrinsic and normalized final scores.
 
     Returns (intrinsic, final_normalized)
@@ -190,35 +208,38 @@ def score_eips(eip_catalog: Dict[str, Dict[str, Any]], shipped_fork_names: set[s
     }
 
     eip_ids = list(eip_catalog.keys())
-    # Engagement raw
+    # One walk over the catalog, one column per feature
+    sqrt, log1p = math.sqrt, math.log1p
     eng_raw = []
     eth_cites_raw = []
-    for eid in eip_ids:
-        e = eip_catalog[eid]
+    status_scores = []
+    fork_scores = []
+    requires_scores = []
+    for e in eip_catalog.values():
         likes = float(e.get("magicians_likes", 0) or 0)
         views = float(e.get("magicians_views", 0) or 0)
         posts = float(e.get("magicians_posts", 0) or 0)
-        eng_raw.append(likes + math.log1p(max(views, 0.0)) + math.sqrt(max(posts, 0.0)))
+        eng_raw.append(likes + log1p(max(views, 0.0)) + sqrt(max(posts, 0.0)))
         eth_cites_raw.append(float(e.get("ethresearch_citation_count", 0) or 0))
+        status_scores.append(status_map.get(str(e.get("status", "")), 0.0))
+        fork_scores.append(1.0 if e.get("fork") in shipped_fork_names else 0.0)
+        requires_scores.append(min(1.0, 0.15 * len(e.get("requires", []) or [])))
 
     eng_pct = percentile_ranks(eng_raw)
     eth_pct = percentile_ranks(eth_cites_raw)
 
-    intrinsic: Dict[str, float] = {}
-    for i, eid in enumerate(eip_ids):
-        e = eip_catalog[eid]
-        status_score = status_map.get(str(e.get("status", "")), 0.0)
-        fork_score = 1.0 if (e.get("fork") or None) in shipped_fork_names else 0.0
-        requires = e.get("requires", []) or []
-        requires_score = min(1.0, 0.15 * len(requires))
-        s = (
+    intrinsic: Dict[str, float] = {
+        eid: (
             0.20 * status_score
-            + 0.25 * eng_pct[i]
-            + 0.25 * eth_pct[i]
+            + 0.25 * eng
+            + 0.25 * eth
             + 0.20 * fork_score
             + 0.10 * requires_score
         )
-        intrinsic[eid] = s
+        for eid, status_score, eng, eth, fork_score, requires_score in zip(
+            eip_ids, status_scores, eng_pct, eth_pct, fork_scores, requires_scores
+        )
+    }
 
     # Clamp then percentile-normalize
     pre_norm = [clamp01(intrinsic[eid]) for eid in eip_ids]
@@ -227,56 +248,38 @@ def score_eips(eip_catalog: Dict[str, Dict[str, Any]], shipped_fork_names: set[s
     return intrinsic, final
 
 
-def score_papers(papers: List[Dict[str, Any]]) -> Tuple[Dict[str, float], Dict[str, float]]:
-    """Compute intrinsic and final percentile-normalized scores for papers."""
+def score_papers(id_papers: List[Tuple[str, Dict[str, Any]]]) -> Tuple[Dict[str, float], Dict[str, float]]:
+    """Compute intrinsic and final percentile-normalized scores for papers.
+
+    Takes the (id, paper) pairs from paper_id_pairs; untitled papers are skipped."""
     # Build arrays
     ids: List[str] = []
     cites_raw: List[float] = []
     rel_raw: List[float] = []
-    for p in papers:
-        pid = str(p.get("id", "")).strip()
-        title = p.get("title")
-        if not pid or not title:
+    years_raw: List[Any] = []
+    for pid, p in id_papers:
+        if not p.get("title"):
             continue
         ids.append(pid)
         cb = int(p.get("cited_by_count", 0) or 0)
         cites_raw.append(float(cb if cb > 0 else 0))
         rel_raw.append(float(p.get("relevance_score", 0.0) or 0.0))
+        years_raw.append(p.get("year"))
 
-    # Citation percentile among nonzero only
-    nonzero = [c for c in cites_raw if c > 0]
-    if len(nonzero) == 0:
-        cites_pct = [0.0 for _ in cites_raw]
-    elif len(nonzero) == 1:
-        # single nonzero => that one gets 0.5, zeros get 0
-        val = nonzero[0]
-        cites_pct = [0.5 if c == val and c > 0 else 0.0 for c in cites_raw]
-    else:
-        nz_sorted = sorted(nonzero)
-        denom = float(len(nonzero) - 1)
-        # map each c>0 to its percentile per spec
-        def nz_rank(v: float) -> float:
-            return bisect_left(nz_sorted, v) / denom
-
-        cites_pct = [nz_rank(c) if c > 0 else 0.0 for c in cites_raw]
+    # Citation percentile among nonzero only; zeros get 0
+    nz_idx = [i for i, c in enumerate(cites_raw) if c > 0]
+    cites_pct = [0.0] * len(cites_raw)
+    for i, pct in zip(nz_idx, percentile_ranks([cites_raw[i] for i in nz_idx])):
+        cites_pct[i] = pct
 
     rel_pct = percentile_ranks(rel_raw)
 
     intrinsic: Dict[str, float] = {}
-    # build id->paper map once
-    pid_map = {str(p.get("id", "")).strip(): p for p in papers if str(p.get("id", "")).strip()}
     for i, pid in enumerate(ids):
         base = 0.55 * cites_pct[i] + 0.45 * rel_pct[i]
         # Recency damping relative to CURRENT_YEAR
-        y = pid_map.get(pid, {}).get("year")
-        damp = 1.0
-        if isinstance(y, int):
-            if y == CURRENT_YEAR:
-                damp = 0.6
-            elif y == CURRENT_YEAR - 1:
-                damp = 0.75
-            elif y == CURRENT_YEAR - 2:
-                damp = 0.9
+        y = years_raw[i]
+        damp = RECENCY_DAMPING.get(y, 1.0) if isinstance(y, int) else 1.0
         intrinsic[pid] = base * damp
 
     # Clamp and percentile-normalize
@@ -286,48 +289,53 @@ def score_papers(papers: List[Dict[str, Any]]) -> Tuple[Dict[str, float], Dict[s
     return intrinsic, final
 
 
-def papers_by_id(papers: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
-    return {str(p.get("id", "")).strip(): p for p in papers if str(p.get("id", "")).strip()}
+def paper_id_pairs(papers: List[Dict[str, Any]]) -> List[Tuple[str, Dict[str, Any]]]:
+    """Normalize paper ids once: (stripped id, paper) for every paper with an id."""
+    return [(pid, p) for p in papers if (pid := str(p.get("id", "")).strip())]
 
 
-# ------------------------------ Pipeline -----------------------------------
-def compute_scores(analysis: Dict[str, Any], papers_payload: Dict[str, Any]) -> Dict[str, Any]:
-    topics = analysis.get("topics", {}) or {}
-    minor_topics = analysis.get("minor_topics", {}) or {}
-    # Combine topics + minor_topics into one pool
+def merge_topics(analysis: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """Combine topics + minor_topics into one pool keyed by str id."""
     all_topics: Dict[str, Dict[str, Any]] = {}
-    for k, v in topics.items():
+    for k, v in (analysis.get("topics", {}) or {}).items():
         all_topics[str(k)] = v
-    for k, v in minor_topics.items():
+    for k, v in (analysis.get("minor_topics", {}) or {}).items():
         all_topics[str(k)] = v
+    return all_topics
+
 
+# ------------------------------ Pipeline -----------------------------------
+def compute_scores(analysis: Dict[str, Any],
+                   all_topics: Dict[str, Dict[str, Any]],
+                   id_papers: List[Tuple[str, Dict[str, Any]]],
+                   paper_count: int) -> Dict[str, Any]:
     eip_catalog: Dict[str, Dict[str, Any]] = analysis.get("eip_catalog", {}) or {}
 
     # Shipped forks: date != None and date <= today
-    shipped_fork_names: set[str] = set()
+    # Names are always truthy, so a fork of None or "" never matches.
+    shipped: set[str] = set()
     today = date.today()
     for f in analysis.get("forks", []) or []:
         d = parse_date(f.get("date"))
         if d is not None and d <= today:
             name = f.get("name")
             if name:
-                shipped_fork_names.add(name)
+                shipped.add(name)
+    shipped_fork_names = frozenset(shipped)
 
     # Phase 1: EIPs first (topics boosts depend on EIP intrinsic)
     eip_intrinsic, eip_final = score_eips(eip_catalog, shipped_fork_names)
 
     # Phase 1: Topics (with cross-entity boosts applied here)
-    topic_intrinsic, topic_boosted_raw = score_topics(all_topics, eip_intrinsic, shipped_fork_names, eip_catalog)
+    topic_intrinsic, topic_boosted_raw, topic_ids = score_topics(all_topics, eip_intrinsic, shipped_fork_names, eip_catalog)
 
-    # Clamp topics then normalize
-    topic_ids = list(all_topics.keys())
-    topic_pre_norm = [clamp01(topic_boosted_raw[tid]) for tid in topic_ids]
+    # Normalize topics (score_topics already clamped the boosted scores)
+    topic_pre_norm = [topic_boosted_raw[tid] for tid in topic_ids]
     topic_final_pct = percentile_ranks(topic_pre_norm)
     topic_final = {topic_ids[i]: topic_final_pct[i] for i in range(len(topic_ids))}
 
     # Papers
-    papers = papers_payload.get("papers", []) if isinstance(papers_payload, dict) else papers_payload
-    paper_intrinsic, paper_final = score_papers(papers)
+    paper_intrinsic, paper_final = score_papers(id_papers)
 
     return {
         "topics": {
@@ -347,20 +355,18 @@ def compute_scores(analysis: Dict[str, Any], papers_payload: Dict[str, Any]) ->
             "counts": {
                 "topics": len(topic_ids),
                 "eips": len(eip_catalog),
-                "papers": len(papers),
+                "papers": paper_count,
             },
         },
     }
 
 
 # ------------------------------ Printing -----------------------------------
-def print_tables(analysis: Dict[str, Any], papers_payload: Dict[str, Any], scores: Dict[str, Any]) -> None:
-    topics = analysis.get("topics", {}) or {}
-    minor_topics = analysis.get("minor_topics", {}) or {}
-    all_topics: Dict[str, Dict[str, Any]] = {**{str(k): v for k, v in topics.items()}, **{str(k): v for k, v in minor_topics.items()}}
+def print_tables(analysis: Dict[str, Any],
+                 all_topics: Dict[str, Dict[str, Any]],
+                 p_by_id: Dict[str, Dict[str, Any]],
+                 scores: Dict[str, Any]) -> None:
     eip_catalog: Dict[str, Dict[str, Any]] = analysis.get("eip_catalog", {}) or {}
-    papers: List[Dict[str, Any]] = papers_payload.get("papers", []) if isinstance(papers_payload, dict) else papers_payload
-    p_by_id = papers_by_id(papers)
 
     topic_final = scores["topics"]["final"]
     topic_intr = scores["topics"]["intrinsic"]
@@ -378,8 +384,7 @@ def print_tables(analysis: Dict[str, Any], papers_payload: Dict[str, Any], score
         old = float(t.get("influence_score", 0.0) or 0.0)
         new = float(topic_final.get(tid, 0.0))
         topic_rows.append((tid, trunc(t.get("title", ""), 50), old, new))
-    topic_rows.sort(key=lambda r: r[3], reverse=True)
-    for i, (tid, title, old, new) in enumerate(topic_rows[:20], start=1):
+    for i, (tid, title, old, new) in enumerate(heapq.nlargest(20, topic_rows, key=lambda r: r[3]), start=1):
         delta = new - old
         print(f"{i:>4} {str(all_topics.get(tid, {}).get('id', tid))[:12]:<12} {title:<50} {old:7.3f} {new:7.3f} {delta:7.3f}")
 
@@ -391,8 +396,7 @@ def print_tables(analysis: Dict[str, Any], papers_payload: Dict[str, Any], score
         old = float(e.get("influence_score", 0.0) or 0.0)
         new = float(eip_final.get(eid, 0.0))
         eip_rows.append((eid, trunc(e.get("title", ""), 50), old, new))
-    eip_rows.sort(key=lambda r: r[3], reverse=True)
-    for i, (eid, title, old, new) in enumerate(eip_rows[:20], start=1):
+    for i, (eid, title, old, new) in enumerate(heapq.nlargest(20, eip_rows, key=lambda r: r[3]), start=1):
         delta = new - old
         print(f"{i:>4} {str(eid):<8} {title:<50} {old:7.3f} {new:7.3f} {delta:7.3f}")
 
@@ -407,8 +411,7 @@ def print_tables(analysis: Dict[str, Any], papers_payload: Dict[str, Any], score
         old_rel = float(p.get("relevance_score", 0.0) or 0.0)
         new = float(paper_final.get(pid, 0.0))
         paper_rows.append((trunc(p.get("title", ""), 55), year, cited, old_rel, new))
-    paper_rows.sort(key=lambda r: r[-1], reverse=True)
-    for i, (title, year, cited, old_rel, new) in enumerate(paper_rows[:20], start=1):
+    for i, (title, year, cited, old_rel, new) in enumerate(heapq.nlargest(20, paper_rows, key=lambda r: r[-1]), start=1):
         print(f"{i:>4} {title:<55} {str(year):>6} {cited:>8} {old_rel:>8.3f} {new:7.3f}")
 
     # === COMBINED TOP 50 ===
@@ -421,8 +424,7 @@ def print_tables(analysis: Dict[str, Any], papers_payload: Dict[str, Any], score
         combined.append(("EIP", str(eid), trunc(e.get("title", ""), 45), float(eip_final.get(eid, 0.0))))
     for pid, p in p_by_id.items():
         combined.append(("Paper", str(pid), trunc(p.get("title", ""), 45), float(paper_final.get(pid, 0.0))))
-    combined.sort(key=lambda r: r[3], reverse=True)
-    for i, (etype, ident, title, new) in enumerate(combined[:50], start=1):
+    for i, (etype, ident, title, new) in enumerate(heapq.nlargest(50, combined, key=lambda r: r[3]), start=1):
         print(f"{i:>4} {etype:<6} {ident:<14} {title:<45} {new:7.3f}")
 
 
@@ -430,8 +432,12 @@ def main() -> None:
     base = Path.cwd()
     analysis = load_json(base / "analysis.json")
     papers_payload = load_json(base / "papers-db.json")
-    scores = compute_scores(analysis, papers_payload)
-    print_tables(analysis, papers_payload, scores)
+    papers = papers_payload.get("papers", []) if isinstance(papers_payload, dict) else papers_payload
+    # Normalized once, shared by scoring and printing
+    all_topics = merge_topics(analysis)
+    id_papers = paper_id_pairs(papers)
+    scores = compute_scores(analysis, all_topics, id_papers, len(papers))
+    print_tables(analysis, all_topics, dict(id_papers), scores)
 
 
 if __name__ == "__main__":
@@ -9,6 +9,7 @@ Usage:
 """
 
 import json
+from operator import itemgetter
 from pathlib import Path
 
 SCRIPT_DIR = Path(__file__).resolve().parent
@@ -46,7 +47,7 @@ def main():
 
     # Flat topics array
     api_topics = []
-    for tid, t in sorted(topics.items(), key=lambda x: x[1]["influence_score"], reverse=True):
+    for t in sorted(topics.values(), key=itemgetter("influence_score"), reverse=True):
         api_topics.append({
             "id": t["id"],
             "title": t["title"],
@@ -137,8 +138,9 @@ def main():
         })
 
     # Compute date range from topics
-    all_dates = sorted(t["date"] for t in topics.values() if t.get("date"))
-    date_range = [all_dates[0], all_dates[-1]] if all_dates else None
+    # ISO date strings order lexicographically, so min/max suffice
+    all_dates = [t["date"] for t in topics.values() if t.get("date")]
+    date_range = [min(all_dates), max(all_dates)] if all_dates else None
 
     output = {
         "metadata": {
@@ -156,8 +158,9 @@ def main():
         "edges": api_edges,
     }
 
-    with open(OUTPUT_PATH, "w") as f:
-        json.dump(output, f, indent=2)
+    # Encode in one go: json.dump(indent=...) writes each small chunk to the
+    # file separately, while dumps joins them before a single write.
+    OUTPUT_PATH.write_text(json.dumps(output, indent=2))
 
     size_kb = OUTPUT_PATH.stat().st_size / 1024
     print(f"Written: {OUTPUT_PATH} ({size_kb:.0f} KB, {len(api_topics)} topics, "
@@ -111,7 +111,7 @@ def _load_papers_for_viz(data):
     rows = []
     if PAPERS_DB_PATH.exists():
         try:
-            with open(PAPERS_DB_PATH) as f:
+            with open(PAPERS_DB_PATH, encoding="utf-8") as f:
                 payload = json.load(f)
             if isinstance(payload, dict):
                 rows = payload.get("papers", []) or []
@@ -788,16 +788,13 @@ def _build_unified_graph(topics, graph, forks, eip_graph, magicians_topics, cros
 
 
 def main():
-    with open(ANALYSIS_PATH) as f:
-        data = json.load(f)
+    data = json.loads(ANALYSIS_PATH.read_bytes())
 
     viz_data = prepare_viz_data(data)
     viz_json = json.dumps(viz_data, separators=(",", ":"))
 
-    html = generate_html(viz_json, data)
-
     with open(OUTPUT_PATH, "w") as f:
-        f.write(html)
+        write_html(f, viz_json, data)
 
     size_kb = OUTPUT_PATH.stat().st_size / 1024
     print(f"Written: {OUTPUT_PATH} ({size_kb:.0f} KB)")
@@ -1138,8 +1135,12 @@ def prepare_viz_data(data):
     }
 
 
-def generate_html(viz_json, data):
-    """Generate the full HTML document."""
+def write_html(out_file, viz_json, data):
+    """Write the full HTML document to out_file.
+
+    Fragments are written in order rather than joined first, so the
+    multi-MB data blob is never copied into one giant document string.
+    """
     meta = data["metadata"]
 
     # Build the JS/CSS as a plain string to avoid f-string brace hell
@@ -1150,7 +1151,7 @@ def generate_html(viz_json, data):
     css = _build_css()
     js = _build_js()
 
-    return f"""<!DOCTYPE html>
+    out_file.write("""<!DOCTYPE html>
 <html lang="en">
 <head>
 <meta charset="UTF-8">
@@ -1158,7 +1159,9 @@ def generate_html(viz_json, data):
 <title>Ethereum Evolution</title>
 <script src="https://d3js.org/d3.v7.min.js"></script>
 <style>
-{css}
+""")
+    out_file.write(css)
+    out_file.write("""
 </style>
 </head>
 <body>
@@ -1318,14 +1321,18 @@ def generate_html(viz_json, data):
 </div>
 
 <script>
-const DATA = {viz_json};
+const DATA = """)
+    out_file.write(viz_json)
+    out_file.write(f""";
 const THREAD_COLORS = {json.dumps(THREAD_COLORS)};
 const THREAD_ORDER = {json.dumps(THREAD_ORDER)};
 const AUTHOR_COLORS = {json.dumps(AUTHOR_COLORS)};
-{js}
+""")
+    out_file.write(js)
+    out_file.write("""
 </script>
 </body>
-</html>"""
+</html>""")
 
 
 def _build_css():
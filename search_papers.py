@@ -65,7 +65,7 @@ def fuzzy_score(query, candidate):
 
 
 def load_papers(path):
-    with open(path) as f:
+    with open(path, encoding="utf-8") as f:
         payload = json.load(f)
     papers = payload.get("papers") if isinstance(payload, dict) else payload
     if not isinstance(papers, list):